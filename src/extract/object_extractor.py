@@ -1,13 +1,124 @@
 import os
 import json
+import mmap
 from loguru import logger
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List
+from src.utils.common import orjson
+
+# Source files are read with a raw file descriptor; O_CLOEXEC and O_BINARY are platform specific
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+# Files at least this large are memory-mapped and parsed in place when orjson is available
+_MMAP_THRESHOLD = 1 << 20
+
+# File loading is I/O bound, so use more threads than cores
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _iter_json_paths(directory: str) -> Iterator[str]:
+    """
+    Yield the paths of all JSON files in a directory.
+
+    Args:
+        directory (str): Path to the directory containing JSON files.
+
+    Yields:
+        str: Path of each JSON file in the directory.
+    """
+    with os.scandir(directory) as entries:
+        for current_file in entries:
+            if current_file.is_file() and current_file.name.endswith(".json"):
+                yield current_file.path
+
+
+def _read_fd_bytes(fd: int, size: int) -> bytes:
+    """
+    Read the whole content of an open file descriptor with a buffer sized from the file itself.
+
+    Bypasses the buffered/text I/O stack: the file is read straight from its
+    descriptor into a buffer sized from fstat, with no intermediate buffer growth.
+
+    Args:
+        fd (int): Open file descriptor, positioned at the start of the file.
+        size (int): File size reported by fstat.
+
+    Returns:
+        bytes: The raw file contents.
+    """
+    chunks = [os.read(fd, size)] if size else []
+
+    # Keep reading in case of a short read or a file that grew since fstat
+    while True:
+        chunk = os.read(fd, max(size, 1 << 16))
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def _parse_json_file(file_path: str) -> Any:
+    """
+    Read and parse a JSON file.
+
+    Small files are read in one buffer. Files of at least _MMAP_THRESHOLD bytes are
+    memory-mapped and handed to orjson directly, so the kernel pages them in lazily
+    and no extra in-memory copy of the raw file is made.
+
+    Args:
+        file_path (str): Path to the JSON file.
+
+    Returns:
+        Any: The parsed JSON document.
+    """
+    fd = os.open(file_path, _OPEN_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+
+        if orjson is not None and size >= _MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+
+        raw_data = _read_fd_bytes(fd, size)
+    finally:
+        os.close(fd)
+
+    if orjson is not None:
+        return orjson.loads(raw_data)
+    return json.loads(raw_data)
+
+
+def _load_json_file(file_path: str) -> Dict[str, Any]:
+    """
+    Load a single JSON file.
+
+    Args:
+        file_path (str): Path to the JSON file.
+
+    Returns:
+        Dict[str, Any]: The parsed file contents.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid JSON.
+    """
+    try:
+        return _parse_json_file(file_path)
+    except (OSError, ValueError) as e:
+        logger.error(f"Error loading source file {file_path}: {e}")
+        raise
 
 
 def fetch_all_objects(directory: str) -> List[Dict[str, Any]]:
     """
     Load all JSON files from a specified directory into a list of dictionaries.
 
+    Files are read concurrently on a thread pool; the returned list keeps the
+    directory listing order. A file that cannot be read or parsed fails the whole
+    load, so the pipeline never runs on an incomplete set of source objects.
+
     Args:
         directory (str): Path to the directory containing JSON files.
 
@@ -19,16 +130,13 @@ def fetch_all_objects(directory: str) -> List[Dict[str, Any]]:
         In production, replace this logic with actual API calls as needed.
     """
     try:
-        json_list = []
+        file_paths = list(_iter_json_paths(directory))
 
-        for current_file in os.scandir(directory):
-            if current_file.is_file() and current_file.name.endswith(".json"):
-                with open(current_file.path, "r") as json_file:
-                    json_data = json.load(json_file)
-                    json_list.append(json_data)
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            json_list = list(executor.map(_load_json_file, file_paths))
 
         logger.info("Source objects loaded successfully.")
         return json_list
     except FileNotFoundError as e:
         logger.error(f"Directory not found: {directory} - {str(e)}")
-        return []
\ No newline at end of file
+        return []
@@ -1,13 +1,84 @@
+import os
+import copy
 import json
 import yaml
 from loguru import logger
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, Any
+from src.utils.common import orjson
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Read configuration files through a 64KB buffer to cut down on small read syscalls
+_IO_BUFFER_SIZE = 1 << 16
+
+# Required keys of every attribute mapping entry
+_get_mapping_fields = itemgetter("field", "container")
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(file_path: str, mtime_ns: int) -> Any:
+    """
+    Parse a YAML file. Cached on (path, modification time) by `_load_yaml`.
+    """
+    with open(file_path, "rb", buffering=_IO_BUFFER_SIZE) as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
+
+def _load_yaml(file_path: str) -> Any:
+    """
+    Load a YAML file, reusing the parsed result until the file is modified.
+
+    Each call returns a deep copy of the cached result, so callers may mutate it.
+
+    Args:
+        file_path (str): Path to the YAML file.
+
+    Returns:
+        Any: The parsed YAML content.
+    """
+    return copy.deepcopy(_load_yaml_cached(file_path, os.stat(file_path).st_mtime_ns))
+
+
+@lru_cache(maxsize=32)
+def _load_json_cached(file_path: str, mtime_ns: int) -> Any:
+    """
+    Parse a JSON file. Cached on (path, modification time) by `_load_json`.
+
+    Uses orjson when available; its decode error subclasses json.JSONDecodeError,
+    so callers handle both decoders the same way.
+    """
+    with open(file_path, "rb", buffering=_IO_BUFFER_SIZE) as file:
+        if orjson is not None:
+            return orjson.loads(file.read())
+        return json.load(file)
+
+
+def _load_json(file_path: str) -> Any:
+    """
+    Load a JSON file, reusing the parsed result until the file is modified.
+
+    Each call returns a deep copy of the cached result, so callers may mutate it.
+
+    Args:
+        file_path (str): Path to the JSON file.
+
+    Returns:
+        Any: The parsed JSON content.
+    """
+    return copy.deepcopy(_load_json_cached(file_path, os.stat(file_path).st_mtime_ns))
 
 
 def load_valid_attribute_names(file_path: str) -> list:
     """
     Loads the list of valid attribute names from a YAML file.
 
+    The file is parsed once per modification; each call returns a new list.
+
     Args:
     - file_path (str): Path to the YAML file containing valid attribute names.
 
@@ -15,19 +86,66 @@ def load_valid_attribute_names(file_path: str) -> list:
     - list: A list of valid attribute names.
     """
     try:
-        with open(file_path, "r") as file:
-            data = yaml.safe_load(file)
-            logger.info("Loaded valid attribute names successfully.")
-            return data.get("valid_attribute_names", [])
+        data = _load_yaml(file_path)
+        logger.info("Loaded valid attribute names successfully.")
+        return data.get("valid_attribute_names", [])
     except Exception as e:
         logger.error(f"Error loading valid attribute names: {e}")
         return []
 
 
+@lru_cache(maxsize=32)
+def _load_attribute_mapping_cached(
+    config_file: str, mtime_ns: int
+) -> Dict[str, Dict[str, str]]:
+    """
+    Parse and validate an attribute mapping file. Cached on (path, modification time)
+    by `load_attribute_mapping`, so each version of the file is validated only once.
+    """
+    config = _load_yaml_cached(config_file, mtime_ns)
+
+    if "attribute_mapping" not in config:
+        raise KeyError("'attribute_mapping' key not found in configuration file")
+
+    attribute_mapping = config["attribute_mapping"]
+
+    # Validate the structure in one pass; only walk it again to describe a failure
+    try:
+        for mapping in attribute_mapping.values():
+            _get_mapping_fields(mapping)
+    except (KeyError, TypeError):
+        _raise_invalid_attribute_mapping(attribute_mapping)
+
+    return attribute_mapping
+
+
+def _raise_invalid_attribute_mapping(attribute_mapping: Dict[str, Any]) -> None:
+    """
+    Find the first invalid entry of an attribute mapping and raise a descriptive error.
+
+    Raises:
+        ValueError: If an entry is not a dict
+        KeyError: If an entry is missing 'field' or 'container'
+    """
+    for attr_name, mapping in attribute_mapping.items():
+        if not isinstance(mapping, dict):
+            raise ValueError(
+                f"Invalid mapping for attribute '{attr_name}': expected dict, got {type(mapping)}"
+            )
+
+        if "field" not in mapping or "container" not in mapping:
+            raise KeyError(
+                f"Missing required keys ('field', 'container') for attribute '{attr_name}'"
+            )
+
+
 def load_attribute_mapping(config_file: str) -> Dict[str, Dict[str, str]]:
     """
     Load attribute mapping configuration from a YAML file.
 
+    The file is parsed and validated once per modification; each call returns
+    a deep copy, so callers may mutate the mapping.
+
     Returns:
         Dict[str, Dict[str, str]]: The attribute mapping dictionary
 
@@ -40,25 +158,9 @@ def load_attribute_mapping(config_file: str) -> Dict[str, Dict[str, str]]:
         if not config_file:
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
 
-        with open(config_file, "r") as f:
-            config = yaml.safe_load(f)
-
-        if "attribute_mapping" not in config:
-            raise KeyError("'attribute_mapping' key not found in configuration file")
-
-        attribute_mapping = config["attribute_mapping"]
-
-        # Validate the structure
-        for attr_name, mapping in attribute_mapping.items():
-            if not isinstance(mapping, dict):
-                raise ValueError(
-                    f"Invalid mapping for attribute '{attr_name}': expected dict, got {type(mapping)}"
-                )
-
-            if "field" not in mapping or "container" not in mapping:
-                raise KeyError(
-                    f"Missing required keys ('field', 'container') for attribute '{attr_name}'"
-                )
+        attribute_mapping = copy.deepcopy(
+            _load_attribute_mapping_cached(config_file, os.stat(config_file).st_mtime_ns)
+        )
 
         logger.info(f"Successfully loaded attribute mapping from {config_file}")
         return attribute_mapping
@@ -77,6 +179,8 @@ def load_attribute_mapping(config_file: str) -> Dict[str, Dict[str, str]]:
 def load_classification_config(config_path: str) -> Dict[str, Any]:
     """
     Load classification configuration from a YAML file.
+
+    The file is parsed once per modification; each call returns a deep copy.
     
     Args:
         config_path (str): Path to the YAML configuration file.
@@ -86,13 +190,12 @@ def load_classification_config(config_path: str) -> Dict[str, Any]:
                        containing classification parameters and settings.
     """
     try:
-        with open(config_path, "r") as file:
-            config = yaml.safe_load(file)
-            if "restrictions" not in config:
-                raise ValueError("Missing 'restrictions' key in classification config")
+        config = _load_yaml(config_path)
+        if "restrictions" not in config:
+            raise ValueError("Missing 'restrictions' key in classification config")
 
-            logger.info("Classification configuration loaded successfully.")
-            return config["restrictions"]
+        logger.info("Classification configuration loaded successfully.")
+        return config["restrictions"]
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     except yaml.YAMLError as e:
@@ -103,6 +206,8 @@ def load_standard_object_schema(schema_path: str) -> dict:
     """
     Load the JSON schema from a file.
 
+    The file is parsed once per modification; each call returns a deep copy.
+
     Args:
         schema_path (str): Path to the JSON schema
     
@@ -110,8 +215,7 @@ def load_standard_object_schema(schema_path: str) -> dict:
         dict: The loaded JSON schema
     """
     try:
-        with open(schema_path, "r") as schema_file:
-            schema = json.load(schema_file)
+        schema = _load_json(schema_path)
         logger.info(f"Schema loaded successfully from {schema_path}")
         return schema
     except FileNotFoundError:
@@ -2,13 +2,57 @@ import os
 import json
 from loguru import logger
 from datetime import datetime
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
 from src.utils.validater import run_validations
 from src.utils.attribute_drift_detector import detect_unexpected_attribute_names
 from src.extract.object_extractor import fetch_all_objects
-from src.transform.preprocessor import prepare_dates
-from src.transform.object_parser import process_objects, clean_object
+from src.transform.object_parser import iter_processed_objects, clean_object
 from src.load.configs_loader import load_attribute_mapping, load_classification_config, load_valid_attribute_names
+from src.utils.common import orjson
+
+# Write output files through a 64KB buffer to cut down on small write syscalls
+_IO_BUFFER_SIZE = 1 << 16
+
+# Each output file is independent, so writes are spread across a thread pool
+_MAX_WORKERS = os.cpu_count() or 1
+
+# Set to "1" to write indented, human-readable output files (e.g. while debugging)
+_PRETTY_JSON_ENV_VAR = "CDS_PRETTY_JSON"
+
+
+def _dump_json(obj: Dict[str, Any], pretty: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, using orjson when available.
+
+    Args:
+        obj (Dict[str, Any]): The object to serialize
+        pretty (bool): Indent the output with 2 spaces instead of writing compact JSON
+
+    Returns:
+        bytes: The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _write_standard_object(
+    file_path: str, obj: Dict[str, Any], pretty: bool = False
+) -> None:
+    """
+    Serialize a single standard object and write it to the given path.
+
+    Args:
+        file_path (str): Destination path of the JSON file
+        obj (Dict[str, Any]): The standard object to write
+        pretty (bool): Write indented JSON instead of compact JSON
+    """
+    # Write the JSON file in a single write
+    with open(file_path, "wb", buffering=_IO_BUFFER_SIZE) as f:
+        f.write(_dump_json(obj, pretty))
 
 
 def _save_standard_objects(
@@ -18,8 +62,11 @@ def _save_standard_objects(
     Save each cleaned standard object to a separate JSON file.
 
     This function saves each cleaned standard object to a JSON file with a filename
-    based on the object ID and current timestamp. It handles file writing errors
-    and ensures proper JSON formatting.
+    based on the object ID and current timestamp. The files are written concurrently
+    on a thread pool. It handles file writing errors and ensures proper JSON formatting.
+
+    Files are written as compact JSON; set the CDS_PRETTY_JSON environment variable
+    to "1" to write indented JSON instead.
 
     Args:
         cleaned_objects (List[Dict[str, Any]]): List of cleaned standard objects to save
@@ -30,39 +77,61 @@ def _save_standard_objects(
     Raises:
         OSError: If the output directory cannot be created or accessed
     """
-    # Generate timestamp for this batch
+    # Generate timestamp for this batch and the filename suffix shared by all its objects
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename_suffix = f"_{timestamp}.json"
+    pretty = os.environ.get(_PRETTY_JSON_ENV_VAR) == "1"
 
+    # Build every filename and path up front so the write loop only does I/O.
+    # Objects sharing an id map to the same path; as with sequential writes, the
+    # last one wins, and only it is submitted so no two threads write the same file.
+    write_jobs: Dict[str, Tuple[int, Dict[str, Any]]] = {}
     for i, obj in enumerate(cleaned_objects):
-        try:
-            # Get object ID, fallback to index if ID is missing
-            obj_id = obj.get("id", f"object_{i}")
-
-            # Create filename with object ID and timestamp
-            filename = f"{obj_id}_{timestamp}.json"
-            file_path = os.path.join(output_path, filename)
-
-            # Ensure the object is JSON serializable
-            if not isinstance(obj, dict):
-                raise ValueError(f"Object {i} is not a valid dictionary")
-
-            # Write JSON file with proper formatting
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(obj, f, indent=2)
-
-            logger.info(f"Successfully saved object {obj_id} to {filename}")
-        except (ValueError, TypeError) as e:
-            error_msg = f"Object {i} serialization error: {e}"
+        # Ensure the object is JSON serializable
+        if not isinstance(obj, dict):
+            error_msg = f"Object {i} serialization error: Object {i} is not a valid dictionary"
             logger.error(error_msg)
-            raise
-        except OSError as e:
-            error_msg = f"File write error for object {i}: {e}"
-            logger.error(error_msg)
-            raise
-        except Exception as e:
-            error_msg = f"Unexpected error saving object {i}: {e}"
-            logger.error(error_msg)
-            raise
+            raise ValueError(f"Object {i} is not a valid dictionary")
+
+        # Get object ID, fallback to index if ID is missing
+        obj_id = obj.get("id", f"object_{i}")
+
+        # Create filename with object ID and timestamp
+        filename = f"{obj_id}{filename_suffix}"
+        file_path = os.path.join(output_path, filename)
+        if file_path in write_jobs:
+            logger.warning(
+                f"Object {i} has the same id as object {write_jobs[file_path][0]}, "
+                f"overwriting {filename}"
+            )
+        write_jobs[file_path] = (i, obj)
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(_write_standard_object, file_path, obj, pretty)
+            for file_path, (_, obj) in write_jobs.items()
+        ]
+
+        # Collect the results in submission order, re-raising the first failure
+        for (i, _), future in zip(write_jobs.values(), futures):
+            try:
+                future.result()
+            except (ValueError, TypeError) as e:
+                error_msg = f"Object {i} serialization error: {e}"
+                logger.error(error_msg)
+                raise
+            except OSError as e:
+                error_msg = f"File write error for object {i}: {e}"
+                logger.error(error_msg)
+                raise
+            except Exception as e:
+                error_msg = f"Unexpected error saving object {i}: {e}"
+                logger.error(error_msg)
+                raise
+
+    logger.info(
+        f"Successfully saved {len(write_jobs)} objects to {output_path} with timestamp {timestamp}"
+    )
 
 
 def run_pipeline(
@@ -113,19 +182,18 @@ def run_pipeline(
         detect_unexpected_attribute_names(
             source_objects, valid_attribute_names, attribute_report_path
         )
-        
-        # Prepare dates in source objects
-        source_objects = prepare_dates(source_objects)
 
-        # Transform each source object into the standard format
-        standard_objects = process_objects(
-            source_objects, attribute_mapping, restrictions_config
+        # Preprocess (including date preparation), transform each source object into
+        # the standard format and remove any empty containers in a single pass
+        cleaned_standard_objects = [
+            clean_object(obj)
+            for obj in iter_processed_objects(
+                source_objects, attribute_mapping, restrictions_config
+            )
+        ]
+        logger.info(
+            f"Processed and cleaned {len(cleaned_standard_objects)} objects into standard format"
         )
-        logger.info(f"Processed {len(standard_objects)} objects into standard format")
-
-        # Apply the cleanup function to all standard objects
-        cleaned_standard_objects = [clean_object(obj) for obj in standard_objects]
-        logger.info("Cleaned standard objects by removing any empty containers")
 
         # Validate all cleaned standard objects and get summary
         validation_summary = run_validations(cleaned_standard_objects, schema_path)
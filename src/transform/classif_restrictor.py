@@ -1,32 +1,109 @@
+import re
+import sys
+from collections import deque
 from loguru import logger
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, NamedTuple, Optional, Pattern, Tuple, Union
 
 
-def is_classif_too_high(ism: Dict[str, Any], config: Dict[str, Any]) -> bool:
+class CompiledConfig(NamedTuple):
+    """
+    Classification configuration prepared for repeated lookups.
+
+    Built once per run by `compile_config` so that every ISM check is a plain
+    hash lookup instead of rebuilding sets from the raw configuration lists.
     """
-    Determines if the classification level in the ISM (Information Security Marking) is too high or contains forbidden values.
+
+    forbidden_sci: FrozenSet[str]
+    forbidden_controls: FrozenSet[str]
+    forbidden_terms: Tuple[str, ...]
+    forbidden_terms_pattern: Pattern[str]
+    special_groups: FrozenSet[str]
+    classifications: Dict[str, int]
+
+
+def compile_config(config: Dict[str, Any]) -> CompiledConfig:
+    """
+    Compile the 'restrictions' section of the classification configuration.
 
     Args:
-        ism (Dict[str, Any]): The ISM dictionary containing classification information.
-        config (Dict[str, Any]): Configuration dictionary with forbidden values:
+        config (Dict[str, Any]): Configuration dictionary with:
             - "forbidden_sci": List of forbidden SCI controls.
             - "forbidden_controls": List of forbidden dissemination controls.
             - "forbidden_terms": List of forbidden terms to check in the banner.
+            - "special_groups": List of special group identifiers.
+            - "classifications": Dict mapping classification levels to numeric values.
+
+    Returns:
+        CompiledConfig: The configuration with frozenset lookups and uppercased forbidden terms.
+    """
+    forbidden_terms = tuple(term.upper() for term in config["forbidden_terms"])
+
+    # One alternation scans the banner once instead of once per term; "(?!)" never matches
+    forbidden_terms_pattern = re.compile(
+        "|".join(map(re.escape, forbidden_terms)) if forbidden_terms else "(?!)"
+    )
+
+    # The vocabularies are small, so intern them: lookups of equal interned strings
+    # resolve on identity without comparing characters
+    intern = sys.intern
+    return CompiledConfig(
+        forbidden_sci=frozenset(map(intern, config["forbidden_sci"])),
+        forbidden_controls=frozenset(map(intern, config["forbidden_controls"])),
+        forbidden_terms=forbidden_terms,
+        forbidden_terms_pattern=forbidden_terms_pattern,
+        special_groups=frozenset(map(intern, config["special_groups"])),
+        classifications={
+            intern(level): rank for level, rank in config["classifications"].items()
+        },
+    )
+
+
+def _as_compiled(config: Union[Dict[str, Any], CompiledConfig]) -> CompiledConfig:
+    """
+    Return the configuration compiled, compiling it if given as the raw dictionary
+    from `load_classification_config`.
+    """
+    if isinstance(config, CompiledConfig):
+        return config
+    return compile_config(config)
+
+
+def is_classif_too_high(
+    ism: Dict[str, Any], config: Union[Dict[str, Any], CompiledConfig]
+) -> bool:
+    """
+    Determines if the classification level in the ISM (Information Security Marking) is too high or contains forbidden values.
+
+    Args:
+        ism (Dict[str, Any]): The ISM dictionary containing classification information.
+        config (Union[Dict[str, Any], CompiledConfig]): The classification configuration
+            with the forbidden SCI controls, dissemination controls and banner terms.
+            A raw dictionary is compiled on every call, so compile it once with
+            `compile_config` when checking many ISMs.
 
     Returns:
         bool: True if the ISM classification is too high or contains forbidden values, False otherwise.
     """
+    return _is_classif_too_high(ism, _as_compiled(config))
+
+
+def _is_classif_too_high(ism: Dict[str, Any], config: CompiledConfig) -> bool:
+    """
+    `is_classif_too_high` for an already compiled configuration.
+    """
     if not ism:
         logger.warning("ISM is empty, cannot determine classification level.")
         return False
 
+    # Cheapest and most selective checks first
+    if ism.get("classification") == "TS":
+        return True
+
+    # Fields may be present but null, so fall back on empty values with "or"
     if (
-        ism.get("classification") == "TS"
-        or set(ism.get("sciControls", [])) & set(config["forbidden_sci"])
-        or set(ism.get("disseminationControls", [])) & set(config["forbidden_controls"])
-        or any(
-            term in ism.get("banner", "").upper() for term in config["forbidden_terms"]
-        )
+        config.forbidden_terms_pattern.search((ism.get("banner") or "").upper()) is not None
+        or not config.forbidden_sci.isdisjoint(ism.get("sciControls") or ())
+        or not config.forbidden_controls.isdisjoint(ism.get("disseminationControls") or ())
     ):
         # logger.warning(f"ISM too high or contains forbidden values: {ism}")
         return True
@@ -34,7 +111,74 @@ def is_classif_too_high(ism: Dict[str, Any], config: Dict[str, Any]) -> bool:
     return False
 
 
-def is_more_restrictive(ism1: Dict[str, Any], ism2: Dict[str, Any], config: Dict[str, Any]) -> bool:
+def _ism_key(ism: Dict[str, Any], config: CompiledConfig) -> Tuple:
+    """
+    Compute the values `is_more_restrictive` compares for an ISM.
+
+    Computing them once per ISM lets a traversal compare each candidate against the
+    current most restrictive ISM without rescanning or rebuilding sets for either side.
+
+    Args:
+        ism (Dict[str, Any]): The ISM dictionary containing security marking information.
+        config (CompiledConfig): Compiled classification configuration providing
+            the special groups and the classification hierarchy
+
+    Returns:
+        Tuple: (has FGI controls, has NOFORN, has REL, special groups it is releasable to,
+            number of releasable entities, classification rank)
+    """
+    dissemination_controls = ism.get("disseminationControls") or ()
+    rel = "REL" in dissemination_controls
+
+    # Releasability is only compared between two REL markings, so skip the set otherwise
+    if rel:
+        release = set(ism.get("releasableTo") or ())
+        groups = config.special_groups.intersection(release)
+        release_count = len(release)
+    else:
+        groups = frozenset()
+        release_count = 0
+
+    return (
+        any(c[:3] == "FGI" for c in ism.get("sciControls") or ()),
+        "NOFORN" in dissemination_controls,
+        rel,
+        groups,
+        release_count,
+        config.classifications.get(ism.get("classification", "U"), 0),
+    )
+
+
+def _is_key_more_restrictive(key1: Tuple, key2: Tuple) -> bool:
+    """
+    Compare two keys built by `_ism_key` following the `is_more_restrictive` hierarchy.
+    """
+    fgi1, noforn1, rel1, groups1, release_count1, rank1 = key1
+    fgi2, noforn2, rel2, groups2, release_count2, rank2 = key2
+
+    # FGI controls
+    if fgi1 != fgi2:
+        return fgi1
+
+    # NOFORN
+    if noforn1 != noforn2:
+        return noforn1
+
+    # REL controls: more restrictive if releasable to fewer groups or fewer entities
+    if rel1 and rel2:
+        if groups1 != groups2:
+            return len(groups1) < len(groups2)
+        return release_count1 < release_count2
+
+    # Classification hierarchy
+    return rank1 > rank2
+
+
+def is_more_restrictive(
+    ism1: Dict[str, Any],
+    ism2: Dict[str, Any],
+    config: Union[Dict[str, Any], CompiledConfig],
+) -> bool:
     """
     Determines if the first ISM (Information Security Marking) is more restrictive than the second.
     
@@ -49,57 +193,22 @@ def is_more_restrictive(ism1: Dict[str, Any], ism2: Dict[str, Any], config: Dict
             Expected keys: "sciControls", "disseminationControls", "releasableTo", "classification"
         ism2 (Dict[str, Any]): Second ISM dictionary containing security marking information.
             Expected keys: "sciControls", "disseminationControls", "releasableTo", "classification"
-        config (Dict[str, Any]): Configuration dictionary containing:
-            - "special_groups": List of special group identifiers
-            - "classifications": Dict mapping classification levels to numeric values
+        config (Union[Dict[str, Any], CompiledConfig]): The classification configuration
+            providing the special groups and the classification hierarchy, raw or compiled
     
     Returns:
         bool: True if ism1 is more restrictive than ism2, False otherwise.
-              Returns False if either ism1 or ism2 is empty/None.
+              Returns False if either ism1 or ism2 is empty/None, or if both are the same ISM.
     """
-    if not ism1 or not ism2:
+    if not ism1 or not ism2 or ism1 is ism2:
         return False
 
-    # FGI controls
-    ism1_fgi = any(c.startswith("FGI") for c in ism1.get("sciControls", []))
-    ism2_fgi = any(c.startswith("FGI") for c in ism2.get("sciControls", []))
-    
-    if ism1_fgi != ism2_fgi:
-        return ism1_fgi
-
-    # NOFORN
-    ism1_noforn = "NOFORN" in ism1.get("disseminationControls", [])
-    ism2_noforn = "NOFORN" in ism2.get("disseminationControls", [])
-    
-    if ism1_noforn != ism2_noforn:
-        return ism1_noforn
-
-    # REL controls
-    rel1 = "REL" in ism1.get("disseminationControls", [])
-    rel2 = "REL" in ism2.get("disseminationControls", [])
-    
-    if rel1 and rel2:
-        ism1_release = set(ism1.get("releasableTo", []))
-        ism2_release = set(ism2.get("releasableTo", []))
-        ism1_groups = ism1_release & set(config["special_groups"])
-        ism2_groups = ism2_release & set(config["special_groups"])
-        
-        # More restrictive if ism1 has fewer groups or fewer releasable entities
-        if ism1_groups != ism2_groups:
-            return len(ism1_groups) < len(ism2_groups)
-        return len(ism1_release) < len(ism2_release)
-
-    # Classification hierarchy
-    classif1 = ism1.get("classification", "U")
-    classif2 = ism2.get("classification", "U")
-    
-    return config["classifications"].get(classif1, 0) > config["classifications"].get(
-        classif2, 0
-    )
+    config = _as_compiled(config)
+    return _is_key_more_restrictive(_ism_key(ism1, config), _ism_key(ism2, config))
 
 
 def find_most_restrictive_valid_ism(
-    obj: Dict[str, Any], config: Dict[str, Any]
+    obj: Dict[str, Any], config: Union[Dict[str, Any], CompiledConfig]
 ) -> Optional[Dict[str, Any]]:
     """
     Traverse a nested object to find the most restrictive valid ISM (Information Security Marking).
@@ -107,15 +216,20 @@ def find_most_restrictive_valid_ism(
     The function searches through all dictionaries and lists within the provided object,
     identifies ISMs that are not too highly classified (using is_classif_too_high),
     and returns the most restrictive valid ISM according to the is_more_restrictive function.
+    Unlike `apply_restrictions`, it does not modify the object.
 
     Args:
         obj (Dict[str, Any]): The object to search for ISMs.
-        config (Dict[str, Any]): The classification configuration dictionary.
+        config (Union[Dict[str, Any], CompiledConfig]): The classification configuration,
+            raw or compiled.
 
     Returns:
-        Optional[Dict[str, Any]]: The most restrictive valid ISM found, or None if no valid ISM exists.
+        Optional[Dict[str, Any]]: A copy of the most restrictive valid ISM found, or None if no valid ISM exists.
     """
+    config = _as_compiled(config)
+
     most_restrictive = None
+    most_restrictive_key = None
     stack = [obj]  # Use a stack to traverse the object hierarchy
 
     while stack:
@@ -124,70 +238,111 @@ def find_most_restrictive_valid_ism(
         if isinstance(item, dict):
             # Check if the current item has an ISM and if it's valid
             if "ism" in item:
-                ism = item.get("ism")
-                if ism and not is_classif_too_high(ism, config):
-                    # Early exit if 'TS' found
-                    if ism.get("classification") == "TS":
-                        return ism.copy()
-                    if most_restrictive is None or is_more_restrictive(
-                        ism, most_restrictive, config
+                ism = item["ism"]
+                if ism and not _is_classif_too_high(ism, config):
+                    ism_key = _ism_key(ism, config)
+                    if most_restrictive is None or _is_key_more_restrictive(
+                        ism_key, most_restrictive_key
                     ):
-                        most_restrictive = ism.copy()
+                        most_restrictive = ism
+                        most_restrictive_key = ism_key
 
             # Add all dictionary values to the stack
             stack.extend(item.values())
         elif isinstance(item, list):
             # Add all list items to the stack
             stack.extend(item)
-    
-    return most_restrictive
+
+    return most_restrictive.copy() if most_restrictive is not None else None
 
 
 def apply_restrictions(
-    standard_object: Dict[str, Any], config: Dict[str, Any]
+    standard_object: Dict[str, Any], config: Union[Dict[str, Any], CompiledConfig]
 ) -> Optional[Dict[str, Any]]:
     """
-    Recursively process a standard object to remove or redact data that is too highly classified,
+    Process a standard object to redact data that is too highly classified,
     according to the provided classification configuration.
 
-    The function finds the most restrictive valid ISM (Information Security Marking) within the object,
-    then traverses all nested dictionaries and lists, replacing any data with a classification that is
-    considered too high with a placeholder. The processed object will include an 'overallClassification'
-    field set to the most restrictive valid ISM found.
+    A single iterative traversal of the nested dictionaries and lists both finds the most
+    restrictive valid ISM (Information Security Marking) and replaces, in place, every item whose
+    classification is considered too high with a placeholder. Redacted items are not descended
+    into, so ISMs nested inside them do not contribute to the overall classification. The
+    object's 'overallClassification' field is set to the most restrictive valid ISM found.
 
     Args:
         standard_object (Dict[str, Any]): The object to process and apply restrictions to.
-        config (Dict[str, Any]): The classification configuration dictionary.
+            It is modified in place.
+        config (Union[Dict[str, Any], CompiledConfig]): The classification configuration,
+            either the dictionary from `load_classification_config` or, to avoid compiling
+            it for every object, the result of `compile_config`.
 
     Returns:
-        Optional[Dict[str, Any]]: The processed object with restricted data redacted, or None if no valid ISM is found.
+        Optional[Dict[str, Any]]: The processed object with restricted data redacted, or None if no valid ISM
+            is found or the object itself is too highly classified.
     """
-    # Find the most restrictive valid ISM in the object
-    most_restrictive_ism = find_most_restrictive_valid_ism(standard_object, config)
+    config = _as_compiled(config)
+
+    most_restrictive_ism = None
+    most_restrictive_key = None
+
+    # Each frame holds the parent container, the key of the item within it and the item
+    stack = deque(((None, None, standard_object),))
+
+    # Local aliases avoid global and attribute lookups for every visited item
+    pop = stack.pop
+    extend = stack.extend
+    _dict = dict
+    _list = list
+    _isinstance = isinstance
+    _is_too_high = _is_classif_too_high
+    _key = _ism_key
+    _is_more = _is_key_more_restrictive
+
+    # ISM dicts can be shared between items, so check each one only once per call.
+    # Keyed on id(): every ISM stays referenced by the object for the whole traversal.
+    too_high_by_id: Dict[int, bool] = {}
+
+    while stack:
+        parent, key, item = pop()
+
+        if _isinstance(item, _dict):
+            if "ism" in item:
+                ism = item["ism"]
+
+                ism_id = id(ism)
+                too_high = too_high_by_id.get(ism_id)
+                if too_high is None:
+                    too_high = too_high_by_id[ism_id] = _is_too_high(ism, config)
+
+                # Redact the whole item and skip its content if the ISM is too high
+                if too_high:
+                    logger.debug("Removing item due to high classification: {}", item)
+                    if parent is None:
+                        # The object itself is too highly classified
+                        return None
+                    parent[key] = None
+                    continue
+
+                if ism:
+                    # Derive the comparison values once per ISM
+                    ism_key = _key(ism, config)
+                    if most_restrictive_ism is None or _is_more(
+                        ism_key, most_restrictive_key
+                    ):
+                        most_restrictive_ism = ism
+                        most_restrictive_key = ism_key
+
+            extend((item, k, v) for k, v in item.items())
+        elif _isinstance(item, _list):
+            extend((item, i, v) for i, v in enumerate(item))
 
     if not most_restrictive_ism:
         # If no valid ISM is found, return None
         logger.warning("No valid ISM found for object")
         return None
 
-    def process_item(item: Any) -> Any:
-        if isinstance(item, dict):
-            # If the item has an ISM, check if it is too high
-            if "ism" in item and is_classif_too_high(item["ism"], config):
-                logger.debug(f"Removing item due to high classification: {item}")
-                return None
-
-            # Process all key-value pairs in the dictionary
-            return {k: process_item(v) for k, v in item.items()}
-        if isinstance(item, list):
-            # Process all items in the list
-            return [process_item(x) for x in item]
-
-        return item  # Return the item as is if it's neither a dict nor a list
-
-    # Process the object and add the overall classification
-    processed_object = process_item(standard_object)
-    if isinstance(processed_object, dict):
-        processed_object["overallClassification"] = most_restrictive_ism
+    # Add the overall classification
+    if isinstance(standard_object, dict):
+        standard_object["overallClassification"] = most_restrictive_ism.copy()
 
-    return processed_object
\ No newline at end of file
+    return standard_object
@@ -1,9 +1,11 @@
 
 from loguru import logger
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from src.transform.preprocessor import preprocess_raw_data
-from src.transform.classif_restrictor import apply_restrictions
+from typing import Dict, Any, Container, Iterator, List, Optional, Tuple
+from src.transform.preprocessor import iter_preprocessed_objects
+from src.transform.classif_restrictor import CompiledConfig, apply_restrictions, compile_config
+from src.utils.common import EMPTY_DICT
+from src.utils.parallel import pool_map, use_process_pool
 
 
 def is_empty_container(container: Any) -> bool:
@@ -16,17 +18,48 @@ def is_empty_container(container: Any) -> bool:
     Returns:
         bool: True if the container is empty or None, False otherwise
     """
-    try:
-        if container is None:
-            return True
-        if isinstance(container, dict):
-            return all(is_empty_container(value) for value in container.values())
-        if isinstance(container, list):
-            return all(is_empty_container(item) for item in container)
-        return False  # For other types, consider them non-empty if they are not None
-    except Exception as e:
-        logger.error(f"Error checking if container is empty: {e}")
-        raise ValueError("Invalid container structure")
+    # Depth-first walk that stops at the first value which is neither None nor a container.
+    # Parsed JSON only holds plain dicts and lists, so exact type checks are enough.
+    stack = [container]
+    while stack:
+        item = stack.pop()
+        if item is None:
+            continue
+        item_type = type(item)
+        if item_type is dict:
+            stack.extend(item.values())
+        elif item_type is list:
+            stack.extend(item)
+        else:
+            return False  # For other types, consider them non-empty if they are not None
+    return True
+
+
+# Define containers that should be arrays in the schema
+_ARRAY_CONTAINERS = {"location", "equipment", "provenance"}  # Add more as needed
+
+
+def fix_object_container_types(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fix the container types of a single standard object to match schema requirements.
+
+    Converts dict containers listed in _ARRAY_CONTAINERS to arrays, in place.
+
+    Args:
+        obj: The standard object to fix
+
+    Returns:
+        The same object with corrected container types
+    """
+    for container_name in _ARRAY_CONTAINERS:
+        if container_name in obj and isinstance(obj[container_name], dict):
+            # Convert dict to array format
+            if obj[container_name]:  # If not empty dict
+                obj[container_name] = [obj[container_name]]
+            else:  # If empty dict
+                obj[container_name] = []
+
+    return obj
 
 
 def fix_container_types(objects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -42,60 +75,96 @@ def fix_container_types(objects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     Returns:
         List of objects with corrected container types
     """
-    # Define containers that should be arrays in the schema
-    array_containers = {"location", "equipment", "provenance"}  # Add more as needed
-
     for obj in objects:
-        for container_name in array_containers:
-            if container_name in obj and isinstance(obj[container_name], dict):
-                # Convert dict to array format
-                if obj[container_name]:  # If not empty dict
-                    obj[container_name] = [obj[container_name]]
-                else:  # If empty dict
-                    obj[container_name] = []
+        fix_object_container_types(obj)
 
     return objects
 
 
 def clean_object(obj: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Remove empty containers from the object.
+    Remove empty containers from the object, in place.
+
+    The processed objects are owned by the pipeline, so nested dicts and lists are
+    pruned where they are instead of being copied.
 
     Args:
         obj: The object to clean
 
     Returns:
-        The cleaned object with empty containers removed
+        The same object with empty containers removed
     """
-    try:
-        if isinstance(obj, dict):
-            # Use dictionary comprehension to clean nested dictionaries
-            return {
-                key: clean_object(value)
-                for key, value in obj.items()
-                if not is_empty_container(value)
-            }
-        elif isinstance(obj, list):
-            # Use list comprehension to clean nested lists
-            return [clean_object(item) for item in obj if not is_empty_container(item)]
-        else:
-            # return non-container value as is.
-            return obj
-    except Exception as e:
-        logger.error(f"Error cleaning object: {e}")
-        raise ValueError("An error occurred while cleaning the object")
-
-
-def extract_ism(acm: dict) -> dict:
-    """Extract the reduced 'ism' structure from any ACM dict."""
-    return {
-        "banner": acm.get("banner"),
-        "classification": acm.get("classif"),
-        "ownerProducer": acm.get("owner_prod"),
-        "releaseableTo": acm.get("rel_to"),
-        "disseminationControls": acm.get("dissem_ctrls"),
+    _clean_in_place(obj)
+    return obj
+
+
+def _clean_in_place(obj: Any) -> bool:
+    """
+    Remove empty containers from obj in place, in a single post-order pass.
+
+    Each child is cleaned before its parent decides whether to keep it, so emptiness
+    is known from the cleaned child instead of re-walking its subtree with
+    is_empty_container.
+
+    Args:
+        obj: The value to clean
+
+    Returns:
+        bool: True if obj is None or a container left empty after cleaning
+    """
+    # Standard objects only hold plain dicts and lists, so exact type checks are enough
+    obj_type = type(obj)
+    if obj_type is dict:
+        empty_keys = [key for key, value in obj.items() if _clean_in_place(value)]
+        for key in empty_keys:
+            del obj[key]
+        return not obj
+    if obj_type is list:
+        obj[:] = [item for item in obj if not _clean_in_place(item)]
+        return not obj
+    return obj is None
+
+
+def extract_ism(
+    acm: Optional[dict], cache: Optional[Dict[int, Tuple[dict, dict]]] = None
+) -> dict:
+    """
+    Extract the reduced 'ism' structure from any ACM dict (None is treated as empty).
+
+    Pass the same cache for every call made while transforming one source object:
+    ACMs that are reused across fields, such as the object's own ACM, are then
+    converted once and share a single ISM dict.
+    """
+    if not acm:
+        # Nothing to look up for a missing or empty ACM
+        return {
+            "banner": None,
+            "classification": None,
+            "ownerProducer": None,
+            "releaseableTo": None,
+            "disseminationControls": None,
+        }
+
+    if cache is not None:
+        # The ACM is stored next to its ISM so a recycled id() can never match
+        cached = cache.get(id(acm))
+        if cached is not None and cached[0] is acm:
+            return cached[1]
+
+    # Called for every mapped attribute, so look up the bound get method only once
+    get = acm.get
+    ism = {
+        "banner": get("banner"),
+        "classification": get("classif"),
+        "ownerProducer": get("owner_prod"),
+        "releaseableTo": get("rel_to"),
+        "disseminationControls": get("dissem_ctrls"),
     }
 
+    if cache is not None:
+        cache[id(acm)] = (acm, ism)
+    return ism
+
 
 def extract_created_date(source_object: Dict[str, Any]) -> Optional[int]:
     """
@@ -108,7 +177,7 @@ def extract_created_date(source_object: Dict[str, Any]) -> Optional[int]:
         Optional[int]: The Unix timestamp of 'Date Of Introduction' if found, otherwise None.
     """
     try:
-        for attr in source_object.get("attributes", {}).get("data", []):
+        for attr in source_object.get("attributes", EMPTY_DICT).get("data", []):
             name = attr.get("attributeName", "").strip().lower()
             
             if name == "date of introduction":
@@ -120,6 +189,10 @@ def extract_created_date(source_object: Dict[str, Any]) -> Optional[int]:
     return None
 
 
+# Lowercased variations of the "Elevation" attribute name
+_ELEVATION_NAMES = frozenset({"elevation", "elevation(m)", "elevation (m)"})
+
+
 def extract_elevation(source_object: Dict[str, Any]) -> Optional[Any]:
     """
     Retrieves the elevation value from the source object, handling variations
@@ -133,58 +206,78 @@ def extract_elevation(source_object: Dict[str, Any]) -> Optional[Any]:
     """
     elevation_value = None
 
-    # Define possible variations of the "Elevation" attribute name
-    elevation_variations = ["elevation", "elevation(m)", "elevation (m)"]
+    # Ensure the source object is a dictionary and contains the expected structure
+    if not isinstance(source_object, dict):
+        logger.error(
+            "Error occurred while retrieving elevation: source object must be a dictionary."
+        )
+        return None
 
     try:
-        # Ensure the source object is a dictionary and contains the expected structure
-        if not isinstance(source_object, dict):
-            raise ValueError("source object must be a dictionary.")
-
-        if (
-            "attributes" not in source_object
-            or "data" not in source_object["attributes"]
-        ):
-            raise KeyError(
-                "source object does not contain the expected 'attributes.data' structure."
-            )
+        attributes = source_object["attributes"]["data"]
 
         # Iterate through the attributes to find the elevation value
-        for attr in source_object["attributes"]["data"]:
+        for attr in attributes:
             attribute_name = attr.get("attributeName", "").lower()
 
-            if (
-                attribute_name in elevation_variations
-                and attr.get("attributeValue") is not None
-            ):
-                elevation_value = attr.get("attributeValue")
-                break  # Exit the loop once the elevation value is found
-
-        if isinstance(elevation_value, str):
-            try:
-                elevation_value = float(elevation_value)
-            except Exception as e:
-                logger.error(f"Error transforming elevation into float: {e}")
-    except Exception as e:
-        # Log the exception for debugging purposes
+            if attribute_name in _ELEVATION_NAMES:
+                value = attr.get("attributeValue")
+                if value is not None:
+                    elevation_value = value
+                    break  # Exit the loop once the elevation value is found
+    except (KeyError, TypeError, AttributeError) as e:
+        # Missing 'attributes.data' structure or malformed attribute entries
         logger.error(f"Error occurred while retrieving elevation: {e}")
+        return None
+
+    if isinstance(elevation_value, str):
+        try:
+            elevation_value = float(elevation_value)
+        except ValueError as e:
+            logger.error(f"Error transforming elevation into float: {e}")
 
     return elevation_value
 
 
-def prepare_attribute_index(source: Dict[str, Any]) -> Dict[str, Dict]:
+# Attributes read by the bespoke ship and facility parsers, always kept in the attribute index
+_PARSER_ATTRIBUTE_NAMES = frozenset({"Echelon", "Name", "OSuffix"})
+
+
+def _is_elevation_name(name: Any) -> bool:
+    """
+    Whether an attribute name is one of the elevation spellings, in any case, that
+    extract_elevation accepts.
+    """
+    return isinstance(name, str) and name.lower() in _ELEVATION_NAMES
+
+
+def prepare_attribute_index(
+    source: Dict[str, Any], wanted: Optional[Container[str]] = None
+) -> Dict[str, Dict]:
     """
     Prepare a complete attribute index including both standard attributes and top-level fields.
 
     Args:
         source: Source dictionary containing object data
+        wanted: Attribute names to index, e.g. the attribute mapping. Attributes that are
+            not in it are never looked up, so they are left out, except for the ones the
+            ship and facility parsers read and the elevation. Indexes everything if None.
 
     Returns:
         Dict[str, Dict]: Attribute index with both regular attributes and transformed top-level fields
     """
     # Get standard attributes from data items
-    data_items = source.get("attributes", {}).get("data", [])
-    attr_index = {item.get("attributeName"): item for item in data_items}
+    data_items = source.get("attributes", EMPTY_DICT).get("data", [])
+    if wanted is None:
+        attr_index = {item.get("attributeName"): item for item in data_items}
+    else:
+        attr_index = {
+            name: item
+            for item in data_items
+            if (name := item.get("attributeName")) in wanted
+            or name in _PARSER_ATTRIBUTE_NAMES
+            or _is_elevation_name(name)
+        }
 
     # Define top-level fields to be included in attribute mapping
     top_level_fields = {
@@ -199,18 +292,67 @@ def prepare_attribute_index(source: Dict[str, Any]) -> Dict[str, Dict]:
         if source_field in source:
             attr_index[attr_name] = {
                 "attributeValue": source[source_field],
-                "acm": source.get("acm", {}),
+                "acm": source.get("acm"),
             }
 
     return attr_index
 
 
-def parse_location(source_object: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def _iter_named_attributes(
+    source: Dict[str, Any], attr_index: Dict[str, Dict], name: str
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every attribute of the source object with the given name, in source order.
+
+    The index keeps only the last attribute of each name, while the ship and facility
+    parsers need the first or any matching one. The index still rules out the common
+    case of an object without the attribute, without scanning the attributes.
+
+    Args:
+        source: Source dictionary containing object data
+        attr_index: Attribute index of source from prepare_attribute_index, which
+            always holds the names in _PARSER_ATTRIBUTE_NAMES
+        name: Attribute name to look for
+
+    Yields:
+        Dict[str, Any]: Each attribute named name
+    """
+    if name not in attr_index:
+        return
+
+    for attr in source.get("attributes", EMPTY_DICT).get("data", []):
+        if attr.get("attributeName") == name:
+            yield attr
+
+
+# Placeholder for a measurement without data. Copied per object, since cleaning mutates it
+_EMPTY_MEASURE = {"value": None, "quality": None, "error": None, "units": None}
+
+
+def _empty_measure() -> Dict[str, Any]:
+    """
+    Build an empty measurement, e.g. for a location altitude.
+    """
+    # Copying the template is cheaper than building the literal key by key
+    measure = _EMPTY_MEASURE.copy()
+    measure["units"] = {"value": None}
+    return measure
+
+
+def parse_location(
+    source_object: Dict[str, Any],
+    ism_cache: Optional[Dict[int, Tuple[dict, dict]]] = None,
+    attr_index: Optional[Dict[str, Dict]] = None,
+) -> Optional[Dict[str, Any]]:
     """
     Processes location information from the input object's geographic data.
 
     Args:
         source_object (Dict[str, Any]): The input object containing location data.
+        ism_cache (Optional[Dict[int, Tuple[dict, dict]]]): extract_ism cache of the current object.
+        attr_index (Optional[Dict[str, Dict]]): Attribute index of source_object from
+            prepare_attribute_index. When given, the attributes are only scanned for the
+            elevation if the index holds one of its spellings, in any case.
 
     Returns:
         Dict[str, Any]: Processed location data, or None if data is invalid.
@@ -241,26 +383,23 @@ def parse_location(source_object: Dict[str, Any]) -> Optional[Dict[str, Any]]:
                 f"Using first two values from {len(coords)}-element coordinate array for object {source_object.get('id')}."
             )
 
-        elevation_value = extract_elevation(source_object)
+        # Skip the attribute scan when the index shows there is no elevation
+        if attr_index is None or any(map(_is_elevation_name, attr_index)):
+            elevation_value = extract_elevation(source_object)
+        else:
+            elevation_value = None
+
+        elevation = _empty_measure()
+        elevation["value"] = elevation_value
 
         return {
-            "ism": extract_ism(location_data.get("acm", {})),
+            "ism": extract_ism(location_data.get("acm"), ism_cache),
             "id": location_data.get("id"),
-            "timestamp": location_data.get("lastVerified", {}).get("timestamp"),
+            "timestamp": location_data.get("lastVerified", EMPTY_DICT).get("timestamp"),
             "latitude": coords[1],
             "longitude": coords[0],
-            "altitude": {
-                "value": None,
-                "quality": None,
-                "error": None,
-                "units": {"value": None},
-            },
-            "elevation": {
-                "value": elevation_value,
-                "quality": None,
-                "error": None,
-                "units": {"value": None},
-            },
+            "altitude": _empty_measure(),
+            "elevation": elevation,
             "derivation": geometry_data.get("type"),
             "quality": None,
             "locationName": None,
@@ -273,7 +412,10 @@ def parse_location(source_object: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 
 
 def parse_ship_class_name(
-    source_object: Dict[str, Any], standard_object: Dict[str, Any]
+    source_object: Dict[str, Any],
+    standard_object: Dict[str, Any],
+    ism_cache: Optional[Dict[int, Tuple[dict, dict]]] = None,
+    attr_index: Optional[Dict[str, Dict]] = None,
 ) -> Dict[str, Any]:
     """
     Updates the standard_object's maritimeMetadata with shipClass and shipName if the object is a ship.
@@ -281,31 +423,36 @@ def parse_ship_class_name(
     Args:
         source_object (Dict[str, Any]): Input dictionary containing vessel information.
         standard_object (Dict[str, Any]): Dictionary to be updated with vessel metadata.
+        ism_cache (Optional[Dict[int, Tuple[dict, dict]]]): extract_ism cache of the current object.
+        attr_index (Optional[Dict[str, Dict]]): Attribute index of source_object from
+            prepare_attribute_index. Built here if not given.
 
     Returns:
         Dict[str, Any]: The updated standard_object.
     """
     try:
-        attributes = source_object.get("attributes", {}).get("data", [])
-        class_name = source_object.get("className")
-        acm = source_object.get("acm", {})
-
-        # Using any() to more efficiently determine shipName-shipClass without a for loop
+        if attr_index is None:
+            attr_index = prepare_attribute_index(source_object, _PARSER_ATTRIBUTE_NAMES)
+        # Determine shipName-shipClass from any of the Echelon attributes
         is_ship = any(
-            attr.get("attributeName") == "Echelon"
-            and attr.get("attributeValue") == "SHIP"
-            for attr in attributes
-        )
-        # Find shipName and its ACM from the attribute
-        ship_name_attr = next(
-            (attr for attr in attributes if attr.get("attributeName") == "Name"),
-            None,
+            attr.get("attributeValue") == "SHIP"
+            for attr in _iter_named_attributes(source_object, attr_index, "Echelon")
         )
 
-        ship_name = ship_name_attr.get("attributeValue") if ship_name_attr else None
-        ship_name_acm = ship_name_attr.get("acm", {}) if ship_name_attr else {}
-
         if is_ship:
+            class_name = source_object.get("className")
+            acm = source_object.get("acm")
+
+            # Find shipName and its ACM from the first Name attribute
+            ship_name_attr = next(
+                _iter_named_attributes(source_object, attr_index, "Name"), None
+            )
+
+            ship_name = ship_name_attr.get("attributeValue") if ship_name_attr else None
+            ship_name_acm = (
+                ship_name_attr.get("acm") if ship_name_attr else None
+            )
+
             if "maritimeMetadata" not in standard_object or not isinstance(
                 standard_object["maritimeMetadata"], dict
             ):
@@ -313,16 +460,16 @@ def parse_ship_class_name(
 
             standard_object["maritimeMetadata"]["shipClass"] = {
                 "value": class_name,
-                "ism": extract_ism(acm),
+                "ism": extract_ism(acm, ism_cache),
             }
             if ship_name:
                 standard_object["maritimeMetadata"]["shipName"] = {
                     "value": ship_name,
-                    "ism": extract_ism(ship_name_acm),
+                    "ism": extract_ism(ship_name_acm, ism_cache),
                 }
 
-            logger.info(
-                f"Set shipClass and shipName for object {standard_object.get('id')}"
+            logger.debug(
+                "Set shipClass and shipName for object {}", standard_object.get("id")
             )
         return standard_object
     except Exception as e:
@@ -333,7 +480,10 @@ def parse_ship_class_name(
 
 
 def parse_facility_name_id(
-    source_object: Dict[str, Any], standard_object: Dict[str, Any]
+    source_object: Dict[str, Any],
+    standard_object: Dict[str, Any],
+    ism_cache: Optional[Dict[int, Tuple[dict, dict]]] = None,
+    attr_index: Optional[Dict[str, Dict]] = None,
 ) -> Dict[str, Any]:
     """
     Updates the standard_object with facilityName and facilityId if the object represents a facility.
@@ -341,32 +491,37 @@ def parse_facility_name_id(
     Args:
         source_object (Dict[str, Any]): Dictionary containing facility information.
         standard_object (Dict[str, Any]): Dictionary to be updated with facility metadata.
+        ism_cache (Optional[Dict[int, Tuple[dict, dict]]]): extract_ism cache of the current object.
+        attr_index (Optional[Dict[str, Dict]]): Attribute index of source_object from
+            prepare_attribute_index. Built here if not given.
 
     Returns:
         Dict[str, Any]: The updated standard_object.
     """
     try:
-        attributes = source_object.get("attributes", {}).get("data", [])
+        if attr_index is None:
+            attr_index = prepare_attribute_index(source_object, _PARSER_ATTRIBUTE_NAMES)
         class_name = source_object.get("className")
-        acm = source_object.get("acm", {})
+        acm = source_object.get("acm")
 
         is_facility = class_name == "Facility"
         facility_name = source_object.get("name")
 
-        # Find OSuffix attribute and its ACM
+        # Find the first OSuffix attribute with a value and its ACM
         facility_id_attr = next(
             (
                 attr
-                for attr in attributes
-                if attr.get("attributeName") == "OSuffix"
-                and attr.get("attributeValue") is not None
+                for attr in _iter_named_attributes(source_object, attr_index, "OSuffix")
+                if attr.get("attributeValue") is not None
             ),
             None,
         )
         facility_id = (
             facility_id_attr.get("attributeValue") if facility_id_attr else None
         )
-        facility_id_acm = facility_id_attr.get("acm", {}) if facility_id_attr else {}
+        facility_id_acm = (
+            facility_id_attr.get("acm") if facility_id_attr else None
+        )
 
         if is_facility:
             if "facility" not in standard_object or not isinstance(
@@ -376,16 +531,16 @@ def parse_facility_name_id(
 
             standard_object["facility"]["facilityName"] = {
                 "value": facility_name,
-                "ism": extract_ism(acm),
+                "ism": extract_ism(acm, ism_cache),
             }
             if facility_id:
                 standard_object["facility"]["facilityId"] = {
                     "value": facility_id,
-                    "ism": extract_ism(facility_id_acm),
+                    "ism": extract_ism(facility_id_acm, ism_cache),
                 }
 
-            logger.info(
-                f"Set facilityName and facilityId for object {standard_object.get('id')}"
+            logger.debug(
+                "Set facilityName and facilityId for object {}", standard_object.get("id")
             )
         return standard_object
     except Exception as e:
@@ -395,10 +550,92 @@ def parse_facility_name_id(
         return standard_object
 
 
+# (root attributes as (attribute name, target field),
+#  nested attributes as (attribute name, target field, container))
+CompiledAttributeMap = Tuple[List[Tuple[str, str]], List[Tuple[str, str, str]]]
+
+
+def compile_attribute_map(
+    attribute_map: Dict[str, Dict[str, str]],
+) -> CompiledAttributeMap:
+    """
+    Split an attribute mapping into the attributes written at the root of the standard
+    object and the ones written into a nested container.
+
+    The attribute mapping is fixed for a whole batch, so it is compiled once and the
+    per-object loops in build_standard_object only unpack tuples instead of looking
+    up 'field' and 'container' or comparing the container with "root" for every
+    attribute of every object.
+
+    Args:
+        attribute_map (Dict[str, Dict[str, str]]): Mapping configuration where keys are attribute names
+            and values are dicts with 'field' and 'container' specifications
+
+    Returns:
+        CompiledAttributeMap: The root (attribute name, target field) tuples and the nested
+            (attribute name, target field, container) tuples, each in the original mapping order
+    """
+    root_attrs = []
+    nested_attrs = []
+    for attr_name, mapping in attribute_map.items():
+        container = mapping["container"]
+        if container == "root":
+            root_attrs.append((attr_name, mapping["field"]))
+        else:
+            nested_attrs.append((attr_name, mapping["field"], container))
+
+    return root_attrs, nested_attrs
+
+
+def _build_standard_object(
+    target_structure: Dict[str, Any],
+    attr_index: Dict[str, Dict],
+    compiled_attribute_map: CompiledAttributeMap,
+    ism_cache: Optional[Dict[int, Tuple[dict, dict]]] = None,
+) -> Dict[str, Any]:
+    """
+    Populate target_structure with the mapped attributes. See build_standard_object.
+
+    Raises on malformed input instead of logging, so batch callers can handle errors
+    once per object.
+    """
+    root_attrs, nested_attrs = compiled_attribute_map
+
+    for attr_name, target_field in root_attrs:
+        item = attr_index.get(attr_name)
+
+        if not item:
+            continue
+
+        target_structure[target_field] = {
+            "value": item.get("attributeValue"),
+            "ism": extract_ism(item.get("acm"), ism_cache),
+        }
+
+    for attr_name, target_field, container in nested_attrs:
+        item = attr_index.get(attr_name)
+
+        if not item:
+            continue
+
+        # Ensure nested container exists (the transform pre-initializes all of them)
+        nested = target_structure.get(container)
+        if nested is None:
+            nested = target_structure[container] = {}
+
+        nested[target_field] = {
+            "value": item.get("attributeValue"),
+            "ism": extract_ism(item.get("acm"), ism_cache),
+        }
+
+    return target_structure
+
+
 def build_standard_object(
     target_structure: Dict[str, Any],
     attr_index: Dict[str, Dict],
-    attribute_map: Dict[str, Dict[str, str]],
+    compiled_attribute_map: CompiledAttributeMap,
+    ism_cache: Optional[Dict[int, Tuple[dict, dict]]] = None,
 ) -> Dict[str, Any]:
     """
     Build a standard object by mapping attributes from the source data to target fields.
@@ -414,8 +651,11 @@ def build_standard_object(
         attr_index (Dict[str, Dict]): Index of attribute data items keyed by attribute name,
             where each item contains 'attributeValue' and 'acm' fields
 
-        attribute_map (Dict[str, Dict[str, str]]): Mapping configuration where keys are attribute names and values are dicts with
-            'field' and 'container' specifications
+        compiled_attribute_map (CompiledAttributeMap): Attribute mapping compiled by
+            compile_attribute_map
+
+        ism_cache (Optional[Dict[int, Tuple[dict, dict]]]): extract_ism cache of the current
+            object, so attributes sharing an ACM share one ISM dict
 
     Returns:
         Dict[str, Any]: The populated target_structure dictionary with mapped attributes organized
@@ -428,36 +668,85 @@ def build_standard_object(
         - Missing attributes in attr_index are silently skipped
     """
     try:
-        for attr_name, mapping in attribute_map.items():
-            item = attr_index.get(attr_name)
+        return _build_standard_object(
+            target_structure, attr_index, compiled_attribute_map, ism_cache
+        )
+    except Exception as e:
+        logger.error(f"Error building standard object: {e}")
+        return {}
+
+
+def _transform_source_object(
+    source: Dict[str, Any],
+    attribute_map: Dict[str, Dict[str, str]],
+    compiled_attribute_map: Optional[CompiledAttributeMap] = None,
+) -> Dict[str, Any]:
+    """
+    Transform a source object into the standard format. See transform_source_object.
 
-            if not item:
-                continue
+    Raises on malformed input instead of logging, so batch callers can handle errors
+    once per object.
+    """
+    if not isinstance(source, dict) or not isinstance(attribute_map, dict):
+        logger.error("Invalid source object or attribute map.")
+        return {}
 
-            target_field = mapping["field"]
-            container = mapping["container"]
+    # Special handling for createdDate.
+    created_date = extract_created_date(source)
+
+    # ACMs are often reused across the fields of one object, so convert each only once
+    ism_cache: Dict[int, Tuple[dict, dict]] = {}
+
+    # Get complete attribute index including top-level fields
+    attr_index = prepare_attribute_index(source, attribute_map)
+
+    # The schema expects location as an array
+    location = parse_location(source, ism_cache, attr_index)
+
+    # Initialize target structure with basic metadata
+    target_structure = {
+        "version": source.get("version"),
+        "overallClassification": extract_ism(source.get("acm"), ism_cache),
+        "id": source.get("id"),
+        "name": source.get("name"),
+        "createdDate": created_date,
+        "lastUpdatedDate": source.get("lastVerified", EMPTY_DICT).get("timestamp"),
+        "excerciseIndicator": source.get("gideId"),
+        "location": [location] if location else [],
+        "maritimeMetadata": {},
+        "landMetadata": {},
+        "equipment": {},
+        "unit": {},
+        "ontology": {},
+        "facility": {},
+        "provenance": {},
+    }
 
-            transformed_value = {
-                "value": item.get("attributeValue"),
-                "ism": extract_ism(item.get("acm", {})),
-            }
+    if compiled_attribute_map is None:
+        compiled_attribute_map = compile_attribute_map(attribute_map)
 
-            if container == "root":
-                target_structure[target_field] = transformed_value
-            else:
-                # Ensure nested container exists
-                if container not in target_structure:
-                    target_structure[container] = {}
-                target_structure[container][target_field] = transformed_value
+    # Build and return the standard object
+    standard_object = _build_standard_object(
+        target_structure, attr_index, compiled_attribute_map, ism_cache
+    )
 
-        return target_structure
-    except Exception as e:
-        logger.error(f"Error building standard object: {e}")
-        return {}
+    # Apply the bespoke functions that parse maritime and facility attributes
+    parse_ship_class_name(source, standard_object, ism_cache, attr_index)
+    parse_facility_name_id(source, standard_object, ism_cache, attr_index)
+
+    # Turn the containers filled above into the arrays the schema requires
+    fix_object_container_types(standard_object)
+
+    logger.debug(
+        "Finished transforming object with ID: {}", standard_object.get("id", "unknown")
+    )
+    return standard_object
 
 
 def transform_source_object(
-    source: Dict[str, Any], attribute_map: Dict[str, Dict[str, str]]
+    source: Dict[str, Any],
+    attribute_map: Dict[str, Dict[str, str]],
+    compiled_attribute_map: Optional[CompiledAttributeMap] = None,
 ) -> Dict[str, Any]:
     """
     Transform a source object into a structured format based on the provided attribute mapping.
@@ -465,59 +754,14 @@ def transform_source_object(
     Args:
         source: The source dictionary containing object data with attributes, ACM, and metadata
         attribute_map: Dictionary mapping attribute names to their target field and container locations
+        compiled_attribute_map: attribute_map already compiled with compile_attribute_map.
+            Batch callers should pass it to avoid recompiling the mapping for every object.
 
     Returns:
         Dict containing the transformed object with structured fields
     """
     try:
-        if not isinstance(source, dict) or not isinstance(attribute_map, dict):
-            logger.error("Invalid source object or attribute map.")
-            return {}
-
-        # Special handling for createdDate.
-        created_date = extract_created_date(source)
-
-        # Initialize target structure with basic metadata
-        target_structure = {
-            "version": source.get("version"),
-            "overallClassification": extract_ism(source.get("acm", {})),
-            "id": source.get("id"),
-            "name": source.get("name"),
-            "createdDate": created_date,
-            "lastUpdatedDate": source.get("lastVerified", {}).get("timestamp"),
-            "excerciseIndicator": source.get("gideId"),
-            "location": parse_location(source),
-            "maritimeMetadata": {},
-            "landMetadata": {},
-            "equipment": {},
-            "unit": {},
-            "ontology": {},
-            "facility": {},
-            "provenance": {},
-        }
-
-        # Get complete attribute index including top-level fields
-        attr_index = prepare_attribute_index(source)
-
-        # Build and return the standard object
-        standard_object = build_standard_object(
-            target_structure, attr_index, attribute_map
-        )
-
-        # Apply the bespoke functions that parse maritime and facility attributes
-        parse_ship_class_name(source, standard_object)
-        parse_facility_name_id(source, standard_object)
-
-        if standard_object is not None:
-            logger.info(
-                f"Finished transforming object with ID: {standard_object.get('id', 'unknown')}"
-            )
-            return standard_object
-        else:
-            logger.warning(
-                f"Transformation resulted in None for object with ID: {source.get('id', 'unknown')}"
-            )
-            return {}
+        return _transform_source_object(source, attribute_map, compiled_attribute_map)
     except Exception as e:
         logger.error(
             f"Error transforming object with ID {source.get('id', 'unknown')}: {e}"
@@ -525,47 +769,128 @@ def transform_source_object(
         return {}
 
 
-def process_objects(
+# Batch-wide configuration of a pool worker, set once by _init_worker
+_worker_config: Optional[
+    Tuple[Dict[str, Dict[str, str]], CompiledAttributeMap, CompiledConfig]
+] = None
+
+
+def _process_source_object(
+    obj: Dict[str, Any],
+    attribute_mapping: Dict[str, Dict[str, str]],
+    compiled_attribute_map: CompiledAttributeMap,
+    compiled_restrictions: CompiledConfig,
+) -> Optional[Dict[str, Any]]:
+    """
+    Transform one preprocessed source object and apply the classification restrictions.
+
+    Returns:
+        Optional[Dict[str, Any]]: The processed object, or None if it was dropped or failed.
+    """
+    try:
+        # Per-object progress is debug output; arguments are only formatted if it is emitted
+        logger.debug("Processing object with ID: {}", obj.get("id"))
+
+        # The surrounding try handles errors, so call the unguarded transform
+        standard_obj = _transform_source_object(
+            obj, attribute_mapping, compiled_attribute_map
+        )
+        return apply_restrictions(standard_obj, compiled_restrictions)
+    except Exception as e:
+        logger.error(f"Unexpected error processing object {obj.get('id')}: {str(e)}")
+        return None
+
+
+def _init_worker(
+    attribute_mapping: Dict[str, Dict[str, str]],
+    compiled_attribute_map: CompiledAttributeMap,
+    compiled_restrictions: CompiledConfig,
+) -> None:
+    """
+    Store the batch configuration in a pool worker, so it is pickled once per worker
+    instead of once per object.
+    """
+    global _worker_config
+    _worker_config = (attribute_mapping, compiled_attribute_map, compiled_restrictions)
+
+
+def _process_in_worker(obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Process one source object in a pool worker initialized by _init_worker.
+    """
+    return _process_source_object(obj, *_worker_config)
+
+
+def iter_processed_objects(
     source_objects: List[Dict[str, Any]],
     attribute_mapping: Dict[str, Dict[str, str]],
     restrictions_config: Dict[str, Any],
-) -> List[Dict[str, Any]]:
+) -> Iterator[Dict[str, Any]]:
     """
-    Processes a list of input objects by parsing, validating, and applying ISM policies.
+    Lazily processes input objects by parsing, validating, and applying ISM policies.
+
+    Source objects are preprocessed lazily and each processed object is yielded as soon
+    as it is ready (container types are already fixed by the transform), so callers can
+    chain further per-object steps without building intermediate lists. Objects are
+    independent, so large batches are transformed on a process pool (see
+    `src.utils.parallel`); the output order is the same either way.
 
     Args:
         source_objects (List[Dict[str, Any]]): List of objects to process.
         attribute_mapping (Dict[str, Dict[str, str]]): Mapping configuration for attributes.
         restrictions_config (Dict[str, Any]): Configuration for classification restrictions.
 
-    Returns:
-        List[Dict[str, Any]]:
-            - A list of processed objects.
+    Yields:
+        Dict[str, Any]: Each successfully processed object.
     """
     logger.info(f"Processing total objects: {len(source_objects)}")
 
-    # Preprocess the raw data to ensure we're working with a clean set
-    preprocessed_objects = preprocess_raw_data(source_objects)
-    logger.info(f"Successfully pre-processed {len(preprocessed_objects)} object(s)")
+    # Preprocess the raw data lazily to ensure we're working with a clean set
+    preprocessed_objects = iter_preprocessed_objects(source_objects)
+
+    # The mapping is the same for every object, so compile it once for the batch
+    compiled_attribute_map = compile_attribute_map(attribute_mapping)
+    compiled_restrictions = compile_config(restrictions_config)
+
+    # Size the pool from the raw batch, since preprocessing only drops invalid objects
+    if use_process_pool(len(source_objects)):
+        processed_objects = pool_map(
+            _process_in_worker,
+            preprocessed_objects,
+            batch_size=len(source_objects),
+            initializer=_init_worker,
+            initargs=(attribute_mapping, compiled_attribute_map, compiled_restrictions),
+        )
+        for processed_obj in processed_objects:
+            if processed_obj is not None:
+                yield processed_obj
+        return
 
-    processed_objects = []
     for obj in preprocessed_objects:  # Iterate over preprocessed raw data
-        try:
-            obj_id = obj.get("id")  # Ensure obj_id is extracted
-            logger.info(f"Processing object with ID: {obj_id}")
+        processed_obj = _process_source_object(
+            obj, attribute_mapping, compiled_attribute_map, compiled_restrictions
+        )
+        if processed_obj is not None:
+            yield processed_obj
 
-            standard_obj = transform_source_object(obj, attribute_mapping)
-            processed_obj = apply_restrictions(standard_obj, restrictions_config)
 
-            if processed_obj is not None:
-                processed_objects.append(processed_obj)
-        except Exception as e:
-            logger.error(
-                f"Unexpected error processing object {obj.get('id')}: {str(e)}"
-            )
-    
-    # Fix container types to match schema requirements
-    cleaned_processed_objects = fix_container_types(processed_objects)
-    logger.info("Fixed container types to match schema requirements")
+def process_objects(
+    source_objects: List[Dict[str, Any]],
+    attribute_mapping: Dict[str, Dict[str, str]],
+    restrictions_config: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    Processes a list of input objects by parsing, validating, and applying ISM policies.
+
+    Args:
+        source_objects (List[Dict[str, Any]]): List of objects to process.
+        attribute_mapping (Dict[str, Dict[str, str]]): Mapping configuration for attributes.
+        restrictions_config (Dict[str, Any]): Configuration for classification restrictions.
 
-    return cleaned_processed_objects
\ No newline at end of file
+    Returns:
+        List[Dict[str, Any]]:
+            - A list of processed objects.
+    """
+    return list(
+        iter_processed_objects(source_objects, attribute_mapping, restrictions_config)
+    )
\ No newline at end of file
@@ -1,6 +1,15 @@
 from loguru import logger
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from datetime import date, datetime, timezone
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional
+from src.utils.common import EMPTY_DICT
+
+# Fields every attribute data item must have
+_REQUIRED_ATTRIBUTE_FIELDS = ("attributeName", "attributeValue")
+_REQUIRED_ATTRIBUTE_FIELD_SET = frozenset(_REQUIRED_ATTRIBUTE_FIELDS)
+
+# Fields every ACM must have
+_REQUIRED_ACM_FIELDS = ("portion", "banner")
+_REQUIRED_ACM_FIELD_SET = frozenset(_REQUIRED_ACM_FIELDS)
 
 
 def _validate_attributes(attributes: Dict[str, Any]) -> None:
@@ -29,14 +38,15 @@ def _validate_attributes(attributes: Dict[str, Any]) -> None:
             f"Invalid attribute type: expected dict, got {type(attributes)}"
         )
 
-    required_fields = ["attributeName", "attributeValue"]
-
     if not attributes["data"]:
         raise ValueError(f"Missing `data` in `attributes`")
 
+    # A superset test on the key view checks all required fields in one C-level call
     attributes_data_keys = attributes["data"][0].keys()
-    if not all(k in attributes_data_keys for k in required_fields):
-        missing_fields = [k for k in required_fields if k not in attributes_data_keys]
+    if not attributes_data_keys >= _REQUIRED_ATTRIBUTE_FIELD_SET:
+        missing_fields = [
+            k for k in _REQUIRED_ATTRIBUTE_FIELDS if k not in attributes_data_keys
+        ]
 
         raise ValueError(f"Missing required fields: {missing_fields}")
     return None
@@ -52,12 +62,10 @@ def _validate_acm(acm: Dict[str, Any]) -> bool:
     Returns:
         bool: True if all required fields are present, False otherwise.
     """
-    required_fields = ["portion", "banner"]
-
-    if not all(field in acm for field in required_fields):
-        missing = [f for f in required_fields if f not in acm]
+    if not (isinstance(acm, dict) and acm.keys() >= _REQUIRED_ACM_FIELD_SET):
+        missing = [f for f in _REQUIRED_ACM_FIELDS if f not in acm]
 
-        logger.warning(f"Missing ACM fields: {missing}")
+        logger.warning("Missing ACM fields: {}", missing)
         return False
 
     return True
@@ -77,21 +85,110 @@ def _validate_required_fields(obj: Dict[str, Any]) -> bool:
     Returns:
         bool: True if all required fields are present and valid, False otherwise.
     """
-    if not obj.get("id"):
+    # Look each field up once
+    get = obj.get
+    obj_id = get("id")
+
+    if not obj_id:
         logger.warning("Raw object is missing 'id' attribute")
         return False
 
-    if not _validate_acm(obj.get("acm", {})):
-        logger.error(f"Failed ACM validation for object {obj.get('id')}")
+    if not _validate_acm(get("acm", EMPTY_DICT)):
+        logger.error("Failed ACM validation for object {}", obj_id)
         return False
 
-    if not obj.get("attributes"):
-        logger.warning(f"No attributes found for object {obj.get('id')}")
+    if not get("attributes"):
+        logger.warning("No attributes found for object {}", obj_id)
         return False
 
     return True
 
 
+def _handle_target_restriction(attr: Dict[str, Any]) -> bool:
+    """
+    Handle Target Restriction - ensure boolean value.
+
+    Returns:
+        bool: Always False, the attribute is kept
+    """
+    attr_value = attr.get("attributeValue")
+    if attr_value is not None:
+        attr["attributeValue"] = bool(attr_value)
+        logger.debug(
+            "Converted Target Restriction to boolean: {}", attr["attributeValue"]
+        )
+    return False
+
+
+def _handle_military_symbology_code(attr: Dict[str, Any]) -> bool:
+    """
+    Handle Military Symbology Code - validate length.
+
+    Returns:
+        bool: True if the code is invalid and the attribute must be removed
+    """
+    attr_value = attr.get("attributeValue")
+    if attr_value is None or (isinstance(attr_value, str) and len(attr_value) != 15):
+        # Mark this attribute for removal instead of setting to None
+        logger.debug(
+            "Removing invalid Military Symbology Code (length: {})",
+            len(attr_value) if attr_value else "None",
+        )
+        return True
+    return False
+
+
+# Handlers of the attributes that need custom processing, by attribute name. Each one
+# updates the attribute in place and returns True if it must be removed.
+_SPECIAL_ATTRIBUTE_HANDLERS: Dict[str, Callable[[Dict[str, Any]], bool]] = {
+    "Target Restriction": _handle_target_restriction,
+    "Military Symbology Code": _handle_military_symbology_code,
+}
+
+
+def _remove_attributes(attributes_data: List[Dict[str, Any]], indexes: List[int]) -> None:
+    """
+    Remove the attributes at the given ascending indexes from attributes_data, in place.
+    """
+    # Remove invalid attributes in reverse order to maintain indices
+    for i in reversed(indexes):
+        attributes_data.pop(i)
+
+
+def _prepare_attributes(
+    attributes_data: List[Dict[str, Any]], special_cases: bool = True, dates: bool = True
+) -> None:
+    """
+    Apply the special attribute handlers and/or the date of introduction conversion to
+    raw attributes, in place, with a single pass over them.
+
+    Shared by handle_special_cases_raw, prepare_object_dates and the pipeline's
+    _prepare_raw_object, which applies both.
+
+    Args:
+        attributes_data: The attributes.data list of a raw object
+        special_cases: Apply _SPECIAL_ATTRIBUTE_HANDLERS and remove invalid attributes
+        dates: Convert the date of introduction to a Unix timestamp
+    """
+    # Use a list to track attributes to remove (to avoid modifying list during iteration)
+    attributes_to_remove = []
+
+    for i, attr in enumerate(attributes_data):
+        attr_name = attr.get("attributeName")
+
+        if not attr_name:
+            continue
+
+        handler = _SPECIAL_ATTRIBUTE_HANDLERS.get(attr_name) if special_cases else None
+        if handler is not None:
+            if handler(attr):
+                attributes_to_remove.append(i)
+        elif dates and _is_date_of_introduction(attr_name):
+            _convert_date_attribute(attr)
+
+    _remove_attributes(attributes_data, attributes_to_remove)
+
+
 def handle_special_cases_raw(raw_object: Dict[str, Any]) -> None:
     """
     Handle special cases for attributes that need custom processing logic on raw objects.
@@ -104,48 +201,77 @@ def handle_special_cases_raw(raw_object: Dict[str, Any]) -> None:
         raw_object: The raw object containing attributes.data to process
     """
     try:
-        attributes_data = raw_object.get("attributes", {}).get("data", [])
-
-        # Use a list to track attributes to remove (to avoid modifying list during iteration)
-        attributes_to_remove = []
-
-        for i, attr in enumerate(attributes_data):
-            attr_name = attr.get("attributeName")
-            attr_value = attr.get("attributeValue")
-
-            if not attr_name:
-                continue
-
-            # Handle Target Restriction - ensure boolean value
-            if attr_name == "Target Restriction":
-                if attr_value is not None:
-                    attr["attributeValue"] = bool(attr_value)
-                    logger.debug(
-                        f"Converted Target Restriction to boolean: {attr['attributeValue']}"
-                    )
-
-            # Handle Military Symbology Code - validate length
-            elif attr_name == "Military Symbology Code":
-                if attr_value is None or (
-                    isinstance(attr_value, str) and len(attr_value) != 15
-                ):
-                    # Mark this attribute for removal instead of setting to None
-                    attributes_to_remove.append(i)
-                    logger.debug(
-                        f"Removing invalid Military Symbology Code (length: {len(attr_value) if attr_value else 'None'})"
-                    )
-
-        # Remove invalid attributes in reverse order to maintain indices
-        for i in reversed(attributes_to_remove):
-            attributes_data.pop(i)
-
+        _prepare_attributes(
+            raw_object.get("attributes", EMPTY_DICT).get("data", []), dates=False
+        )
     except Exception as e:
         logger.error(
             f"Error handling special cases for object {raw_object.get('id', 'unknown')}: {e}"
         )
 
 
-def preprocess_raw_data(raw_objects: List[Dict[str, Any]]):
+def _prepare_raw_object(raw_object: Dict[str, Any]) -> None:
+    """
+    Apply handle_special_cases_raw and prepare_object_dates to a raw object, in place,
+    with a single pass over its attributes instead of one pass each.
+
+    Args:
+        raw_object: The validated raw object to prepare
+    """
+    _prepare_last_verified_timestamp(raw_object)
+
+    try:
+        _prepare_attributes(raw_object.get("attributes", EMPTY_DICT).get("data", []))
+    except Exception as e:
+        logger.error(
+            f"Error preparing attributes for object {raw_object.get('id', 'unknown')}: {e}"
+        )
+
+
+def iter_preprocessed_objects(
+    raw_objects: Iterable[Dict[str, Any]],
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily preprocesses raw data objects by validating and filtering them.
+
+    Each object is validated and prepared in place (see preprocess_raw_data) and
+    yielded as soon as it passes, so callers can process it right away without
+    building a list of the whole batch.
+
+    Args:
+        raw_objects (Iterable[Dict[str, Any]]): Raw data objects to preprocess.
+
+    Yields:
+        Dict[str, Any]: Each object that passed all validation steps.
+    """
+    preprocessed_count = 0
+
+    for obj in raw_objects:
+        # 1. First validate required fields
+        if not _validate_required_fields(obj):
+            continue
+
+        # 2. Then validate attributes (present and non-empty after step 1)
+        try:
+            _validate_attributes(obj["attributes"])
+        except ValueError as e:
+            logger.error(
+                "Attribute validation failed for object {}: {}", obj["id"], e
+            )
+            continue
+
+        # 3-4. Handle special cases for attribute processing and convert dates,
+        # in a single pass over the attributes
+        _prepare_raw_object(obj)
+
+        # 5. If all validations pass, hand the object over
+        preprocessed_count += 1
+        yield obj
+
+    logger.info(f"Successfully pre-processed {preprocessed_count} object(s)")
+
+
+def preprocess_raw_data(raw_objects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Preprocesses a list of raw data objects by validating and filtering them.
     
@@ -153,7 +279,8 @@ def preprocess_raw_data(raw_objects: List[Dict[str, Any]]):
     1. Validates required fields for each object
     2. Validates object attributes 
     3. Handles special cases for attribute processing
-    4. Returns only objects that pass all validation steps
+    4. Converts date strings to Unix timestamps (see prepare_object_dates)
+    5. Returns only objects that pass all validation steps
     
     Args:
         raw_objects (List[Dict[str, Any]]): List of raw data objects to preprocess.
@@ -165,30 +292,141 @@ def preprocess_raw_data(raw_objects: List[Dict[str, Any]]):
             all validation steps. Objects that fail validation are excluded from
             the result.
     """
-    processed_data = []
+    return list(iter_preprocessed_objects(raw_objects))
 
-    for obj in raw_objects:
-        # 1. First validate required fields
-        if not _validate_required_fields(obj):
-            continue
 
-        # 2. Then validate attributes
-        attributes = obj.get("attributes", {})
+# Supported date formats, tried in order by the strptime fallback of _to_unix
+_DATE_FORMATS = ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d")
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_SECONDS_PER_DAY = 86400
+
 
+def _is_iso_shaped(date_str: str) -> bool:
+    """
+    Check that a date string has the exact zero-padded layout of one of _DATE_FORMATS,
+    i.e. a layout that datetime.fromisoformat parses to the same value as strptime.
+    """
+    length = len(date_str)
+    if date_str[4:5] != "-" or date_str[7:8] != "-":
+        return False
+    if length == 10:
+        return True  # YYYY-MM-DD
+    return (
+        date_str[-1] == "Z"
+        and date_str[10:11] == "T"
+        and date_str[13:14] == ":"
+        and date_str[16:17] == ":"
+        # YYYY-MM-DDTHH:MM:SSZ or YYYY-MM-DDTHH:MM:SS.ffffffZ with 1 to 6 digits
+        and (
+            length == 20
+            or (22 <= length <= 27 and date_str[19] == "." and date_str[20:-1].isdigit())
+        )
+    )
+
+
+def _to_unix(date_str: str) -> Optional[int]:
+    """
+    Convert a date string in one of the supported formats to a Unix timestamp.
+
+    All formats are read as UTC, so the result does not depend on the server's timezone.
+    Well-formed values are parsed with fromisoformat, which is much faster than strptime,
+    and plain dates are converted with integer day arithmetic; anything else goes
+    through the strptime formats.
+
+    Args:
+        date_str (str): The date string to convert.
+
+    Returns:
+        Optional[int]: The Unix timestamp, or None if no supported format matches.
+    """
+    if _is_iso_shaped(date_str):
         try:
-            _validate_attributes(attributes)
-        except ValueError as e:
-            logger.error(
-                f"Attribute validation failed for object {obj.get('id')}: {str(e)}"
-            )
+            if len(date_str) == 10:
+                # Midnight UTC straight from the day number, without any timezone lookup
+                day = date.fromisoformat(date_str).toordinal()
+                return (day - _EPOCH_ORDINAL) * _SECONDS_PER_DAY
+
+            parsed = datetime.fromisoformat(date_str[:-1])
+            return int(parsed.replace(tzinfo=timezone.utc).timestamp())
+        except ValueError:
+            pass
+
+    for fmt in _DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(date_str, fmt)
+            return int(parsed.replace(tzinfo=timezone.utc).timestamp())
+        except Exception:
             continue
+    return None
+
+
+# Normalized name of the attribute holding the date of introduction
+_DATE_OF_INTRODUCTION = "date of introduction"
+
+# Spellings of that name seen in the source data, matched without normalizing
+_DATE_OF_INTRODUCTION_NAMES = frozenset(
+    {"Date Of Introduction", "Date of Introduction", "date of introduction"}
+)
 
-        # 3. Handle special cases for attribute processing
-        handle_special_cases_raw(obj)
 
-        # 4. If all validations pass, format and add to processed data
-        processed_data.append(obj)
-    return processed_data
+def _is_date_of_introduction(attr_name: str) -> bool:
+    """
+    Check whether an attribute name is the date of introduction, ignoring case and
+    surrounding whitespace.
+    """
+    if attr_name in _DATE_OF_INTRODUCTION_NAMES:
+        return True
+
+    # Only names at least as long as the normalized name can match it once stripped,
+    # so shorter ones are rejected without allocating normalized copies
+    return (
+        len(attr_name) >= len(_DATE_OF_INTRODUCTION)
+        and attr_name.strip().lower() == _DATE_OF_INTRODUCTION
+    )
+
+
+def _prepare_last_verified_timestamp(obj: Dict[str, Any]) -> None:
+    """
+    Convert the 'lastVerified' timestamp of a source object to Unix time, in place.
+    """
+    ts = obj.get("lastVerified", EMPTY_DICT).get("timestamp")
+
+    if isinstance(ts, str):
+        unix_ts = _to_unix(ts)
+        if unix_ts is not None:
+            obj["lastVerified"]["timestamp"] = unix_ts
+
+
+def _convert_date_attribute(attr: Dict[str, Any]) -> None:
+    """
+    Convert the date string value of an attribute to Unix time, in place.
+    """
+    date_str = attr.get("attributeValue")
+
+    if isinstance(date_str, str):
+        unix_ts = _to_unix(date_str)
+        if unix_ts is not None:
+            attr["attributeValue"] = unix_ts
+
+
+def prepare_object_dates(obj: Dict[str, Any]) -> None:
+    """
+    Convert date strings to Unix timestamps in a single source object, in place.
+
+    Converts the 'lastVerified' timestamp and the "date of introduction" attribute
+    value. Values that are already converted are left untouched.
+
+    Args:
+        obj (Dict[str, Any]): The source object containing date fields to be converted.
+    """
+    # lastVerified.timestamp
+    _prepare_last_verified_timestamp(obj)
+
+    # Date Of Introduction in attributes
+    _prepare_attributes(
+        obj.get("attributes", EMPTY_DICT).get("data", []), special_cases=False
+    )
 
 
 def prepare_dates(source_objects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -204,6 +442,8 @@ def prepare_dates(source_objects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     - ISO format with microseconds: "%Y-%m-%dT%H:%M:%S.%fZ"
     - ISO format without microseconds: "%Y-%m-%dT%H:%M:%SZ" 
     - Date only format: "%Y-%m-%d"
+
+    All values are interpreted as UTC; a date only value maps to midnight UTC.
     
     Args:
         source_objects (List[Dict[str, Any]]): A list of dictionary objects
@@ -214,32 +454,8 @@ def prepare_dates(source_objects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             converted to Unix timestamps where applicable. Objects are
             modified in-place.
     """
-    def to_unix(date_str: str) -> Optional[int]:
-        for fmt in ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d"):
-            try:
-                return int(datetime.strptime(date_str, fmt).timestamp())
-            except Exception:
-                continue
-        return None
-
     for obj in source_objects:
-        # lastVerified.timestamp
-        ts = obj.get("lastVerified", {}).get("timestamp")
-        
-        if isinstance(ts, str):
-            unix_ts = to_unix(ts)
-            if unix_ts is not None:
-                obj["lastVerified"]["timestamp"] = unix_ts
-
-        # Date Of Introduction in attributes
-        for attr in obj.get("attributes", {}).get("data", []):
-            if attr.get("attributeName", "").strip().lower() == "date of introduction":
-                date_str = attr.get("attributeValue")
-                
-                if isinstance(date_str, str):
-                    unix_ts = to_unix(date_str)
-                    if unix_ts is not None:
-                        attr["attributeValue"] = unix_ts
+        prepare_object_dates(obj)
 
     logger.info("Dates prepared successfully.")
     return source_objects
\ No newline at end of file
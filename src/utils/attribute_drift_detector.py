@@ -1,7 +1,27 @@
+import json
 import yaml
 from loguru import logger
 from difflib import get_close_matches
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, TextIO, Tuple
+from src.utils.common import EMPTY_DICT, orjson
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is an optional speedup, fall back to difflib
+    process = None
+
+# Entries of list sections written to the report per yaml.dump call
+_REPORT_DUMP_BATCH_SIZE = 1000
+
+# Number of suggestions kept per unexpected attribute name and their minimum similarity
+_FUZZY_MATCH_LIMIT = 3
+_FUZZY_MATCH_CUTOFF = 0.6
 
 
 def capture_unexpected_attributes(
@@ -12,42 +32,58 @@ def capture_unexpected_attributes(
 
     Args:
     - source_objects (List[Dict[str, Any]]): A list of JSON objects to check.
-    - valid_attribute_names (List[str]): A list of valid attribute names.
+    - valid_attribute_names (List[str]): A list (or set) of valid attribute names.
 
     Returns:
     - Dict[str, Any]: Dictionary containing unexpected attributes and their details.
     """
+    # Hash lookups instead of scanning the list for every attribute
+    if isinstance(valid_attribute_names, (set, frozenset)):
+        valid_names = valid_attribute_names
+    else:
+        valid_names = frozenset(valid_attribute_names)
+
     unexpected_attributes = {}
     total_attributes_checked = 0
     objects_with_issues = []
 
+    # Local aliases avoid attribute lookups for every checked attribute
+    get_unexpected = unexpected_attributes.get
+    add_object_with_issues = objects_with_issues.append
+
     for obj_index, json_object in enumerate(source_objects):
-        attributes = json_object.get("attributes", {}).get("data", [])
+        attributes = json_object.get("attributes", EMPTY_DICT).get("data", ())
+        total_attributes_checked += len(attributes)
+        obj_id = json_object.get("id", "unknown")
         object_unexpected = []
+        add_object_unexpected = object_unexpected.append
 
         for attr_index, attribute in enumerate(attributes):
-            total_attributes_checked += 1
             attribute_name = attribute.get("attributeName")
 
-            if attribute_name not in valid_attribute_names:
-                if attribute_name not in unexpected_attributes:
-                    unexpected_attributes[attribute_name] = {"count": 0, "objects": []}
+            if attribute_name not in valid_names:
+                details = get_unexpected(attribute_name)
+                if details is None:
+                    details = unexpected_attributes[attribute_name] = {
+                        "count": 0,
+                        "objects": [],
+                    }
 
-                unexpected_attributes[attribute_name]["count"] += 1
-                unexpected_attributes[attribute_name]["objects"].append(
+                details["count"] += 1
+                details["objects"].append(
                     {
                         "object_index": obj_index,
                         "attribute_index": attr_index,
-                        "object_id": json_object.get("id", "unknown"),
+                        "object_id": obj_id,
                     }
                 )
-                object_unexpected.append(attribute_name)
+                add_object_unexpected(attribute_name)
 
         if object_unexpected:
-            objects_with_issues.append(
+            add_object_with_issues(
                 {
                     "object_index": obj_index,
-                    "object_id": json_object.get("id", "unknown"),
+                    "object_id": obj_id,
                     "unexpected_attributes": object_unexpected,
                 }
             )
@@ -60,6 +96,44 @@ def capture_unexpected_attributes(
     }
 
 
+@lru_cache(maxsize=4096)
+def _find_close_matches(
+    name: str, valid_attribute_names: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """
+    Finds the valid attribute names most similar to an unexpected attribute name.
+
+    Cached on the name and the valid names, so names that keep showing up across
+    runs in the same process are only matched once per list of valid names.
+
+    Uses RapidFuzz's C++ scorer when it is installed and `difflib.get_close_matches`
+    otherwise. Both rank by a similarity ratio in [0, 1], but RapidFuzz's Indel ratio
+    can score some pairs slightly higher than difflib, so suggestions may differ at the margin.
+
+    Args:
+    - name (str): The unexpected attribute name.
+    - valid_attribute_names (Tuple[str, ...]): Valid attribute names for matching.
+
+    Returns:
+    - Tuple[str, ...]: Up to 3 valid names, best match first.
+    """
+    if process is not None:
+        matches = process.extract(
+            name,
+            valid_attribute_names,
+            scorer=fuzz.ratio,
+            limit=_FUZZY_MATCH_LIMIT,
+            score_cutoff=_FUZZY_MATCH_CUTOFF * 100,
+        )
+        return tuple(match for match, _, _ in matches)
+
+    return tuple(
+        get_close_matches(
+            name, valid_attribute_names, n=_FUZZY_MATCH_LIMIT, cutoff=_FUZZY_MATCH_CUTOFF
+        )
+    )
+
+
 def add_fuzzy_matching(
     unexpected_attributes: Dict[str, Any], valid_attribute_names: List[str]
 ) -> None:
@@ -70,29 +144,83 @@ def add_fuzzy_matching(
     - unexpected_attributes (Dict[str, Any]): Dictionary of unexpected attributes to enhance.
     - valid_attribute_names (List[str]): List of valid attribute names for matching.
     """
+    # Hashable, order-preserving key for the match cache
+    valid_names = tuple(valid_attribute_names)
 
     for unexpected_name in unexpected_attributes.keys():
-        similar_names = get_close_matches(
-            unexpected_name, valid_attribute_names, n=3, cutoff=0.6
-        )
+        # A fresh list per entry so the report never shares or mutates cached results
+        similar_names = list(_find_close_matches(unexpected_name, valid_names))
         unexpected_attributes[unexpected_name]["similar_valid_names"] = similar_names
 
 
+def _dump_report_section(file: TextIO, key: str, value: Any) -> None:
+    """
+    Writes one top-level section of the analysis report.
+
+    Non-empty lists are written in batches of entries, so only one batch is
+    represented by the YAML dumper at a time. The output is the same as dumping the
+    section as part of the whole report.
+
+    Args:
+    - file (TextIO): The open report file.
+    - key (str): Name of the section.
+    - value (Any): Content of the section.
+    """
+    if not isinstance(value, list) or not value:
+        yaml.dump({key: value}, file, Dumper=_YamlDumper, default_flow_style=False)
+        return
+
+    file.write(f"{key}:\n")
+    for start in range(0, len(value), _REPORT_DUMP_BATCH_SIZE):
+        yaml.dump(
+            value[start : start + _REPORT_DUMP_BATCH_SIZE],
+            file,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+        )
+
+
+def _write_json_report(report_data: Dict[str, Any], attribute_report_path: str) -> None:
+    """
+    Writes the analysis report as indented JSON, using orjson when available.
+
+    Args:
+    - report_data (Dict[str, Any]): The report to write.
+    - attribute_report_path (str): Path to save the report.
+    """
+    # Attributes without a name are reported under a null key, written as "null".
+    # orjson writes raw UTF-8, so keep non-ASCII text unescaped in the fallback too.
+    if orjson is not None:
+        data = orjson.dumps(
+            report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        data = json.dumps(report_data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    with open(attribute_report_path, "wb") as file:
+        file.write(data)
+
+
 def save_analysis_report(
     analysis_results: Dict[str, Any],
     attribute_report_path: str,
+    report_format: str = "yaml",
 ) -> bool:
     """
-    Saves the analysis results to a YAML file.
+    Saves the analysis results to a YAML file, or to a JSON file for reports read by other programs.
 
     Args:
     - analysis_results (Dict[str, Any]): Results from the attribute analysis.
     - attribute_report_path (str): Path to save the report.
+    - report_format (str): "yaml" (default) or "json".
 
     Returns:
     - bool: True if successful, False otherwise.
     """
     try:
+        if report_format not in ("yaml", "json"):
+            raise ValueError(f"Unsupported report format: {report_format}")
+
         report_data = {
             "analysis_summary": {
                 "total_objects_checked": analysis_results["total_objects_checked"],
@@ -108,8 +236,14 @@ def save_analysis_report(
             "affected_objects": analysis_results["objects_with_issues"],
         }
 
-        with open(attribute_report_path, "w") as file:
-            yaml.dump(report_data, file, default_flow_style=False)
+        if report_format == "json":
+            _write_json_report(report_data, attribute_report_path)
+        else:
+            # Write one section at a time, in the sorted order yaml.dump uses for the whole
+            # report, instead of building the representation of the full report at once
+            with open(attribute_report_path, "w") as file:
+                for key in sorted(report_data):
+                    _dump_report_section(file, key, report_data[key])
         logger.info(f"Analysis report saved to '{attribute_report_path}'")
         return True
 
@@ -122,6 +256,7 @@ def detect_unexpected_attribute_names(
     source_objects: List[Dict[str, Any]],
     valid_attribute_names: List[str],
     attribute_report_path: str,
+    report_format: str = "yaml",
 ) -> Dict[str, Any]:
     """
     Main function to detect unexpected attribute names with comprehensive reporting.
@@ -130,6 +265,7 @@ def detect_unexpected_attribute_names(
     - source_objects (List[Dict[str, Any]]): A list of JSON objects to check.
     - valid_attribute_names (List[str]): A list of valid attribute names.
     - attribute_report_path (str): Path to save the detailed report.
+    - report_format (str): Format of the detailed report, "yaml" (default) or "json".
 
     Returns:
     - Dict[str, Any]: Summary of findings.
@@ -161,7 +297,7 @@ def detect_unexpected_attribute_names(
                 )
 
         # Save detailed report
-        save_analysis_report(analysis_results, attribute_report_path)
+        save_analysis_report(analysis_results, attribute_report_path, report_format)
     else:
         logger.info("No unexpected attribute names detected.")
 
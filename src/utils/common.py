@@ -0,0 +1,12 @@
+from types import MappingProxyType
+from typing import Any, Mapping
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, callers fall back to the stdlib json module
+    orjson = None
+
+# Shared read-only default for lookups of optional dict fields, e.g.
+# obj.get("attributes", EMPTY_DICT).get("data", []), saving an allocation per call.
+# Only use it as a lookup default: it is not a dict, so never store it in an output object.
+EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
@@ -0,0 +1,55 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Tuple
+
+# Batches at least this large are processed on a process pool; smaller ones are not
+# worth the cost of starting workers and pickling objects to and from them
+PARALLEL_MIN_OBJECTS = 1000
+
+MAX_WORKERS = os.cpu_count() or 1
+
+
+def use_process_pool(batch_size: int) -> bool:
+    """
+    Decide whether a batch of independent objects is worth processing on a process pool.
+
+    Args:
+        batch_size (int): Number of objects in the batch.
+
+    Returns:
+        bool: True if more than one CPU is available and the batch has at least
+            PARALLEL_MIN_OBJECTS objects, False otherwise.
+    """
+    return MAX_WORKERS > 1 and batch_size >= PARALLEL_MIN_OBJECTS
+
+
+def pool_map(
+    func: Callable[..., Any],
+    *iterables: Iterable[Any],
+    batch_size: int,
+    initializer: Callable[..., None],
+    initargs: Tuple[Any, ...] = (),
+) -> Iterator[Any]:
+    """
+    Lazily map a function over a batch on a process pool, yielding results in input order.
+
+    The batch-wide state a worker needs is passed once through `initializer`, which
+    stores it in a module global for `func` to read, instead of pickling it with every
+    object. Objects are sent to the workers in chunks of about a quarter of each worker's
+    share of the batch, so every worker gets several chunks to balance the load.
+
+    Args:
+        func (Callable[..., Any]): Function applied to each item; must be picklable.
+        *iterables (Iterable[Any]): The arguments of `func`, as for the builtin map.
+        batch_size (int): Number of items in the batch, used to size the chunks.
+        initializer (Callable[..., None]): Called once in each worker with `initargs`.
+        initargs (Tuple[Any, ...]): Arguments of `initializer`.
+
+    Yields:
+        Any: The result of `func` for each item.
+    """
+    chunksize = max(1, batch_size // (4 * MAX_WORKERS))
+    with ProcessPoolExecutor(
+        max_workers=MAX_WORKERS, initializer=initializer, initargs=initargs
+    ) as executor:
+        yield from executor.map(func, *iterables, chunksize=chunksize)
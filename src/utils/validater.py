@@ -1,58 +1,187 @@
+import os
 from loguru import logger
-from typing import Dict, Any, List
-from jsonschema import validate, ValidationError
+from functools import lru_cache, reduce
+from operator import getitem
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
+from jsonschema import ValidationError
+from jsonschema.exceptions import SchemaError, relevance
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from src.load.configs_loader import load_standard_object_schema
+from src.utils.parallel import pool_map, use_process_pool
+
+try:
+    import fastjsonschema
+except ImportError:  # fastjsonschema is an optional speedup, fall back to jsonschema alone
+    fastjsonschema = None
+
+# Validators of a pool worker, set once by _init_worker
+_worker_validators: Optional[Tuple[Validator, Optional[Callable[[Any], Any]]]] = None
+
+
+def _build_validator(schema: Dict[str, Any]) -> Validator:
+    """
+    Check a JSON schema and build a validator of the matching draft for it.
+
+    Raises:
+        SchemaError: If the schema itself is invalid
+    """
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+@lru_cache(maxsize=8)
+def _compile_schema_validator(schema_path: str, mtime_ns: int) -> Validator:
+    """
+    Check a JSON schema and build a reusable validator for it.
+
+    Cached on (path, modification time), so the schema is checked and compiled once
+    per file version instead of on every validated object.
+
+    Args:
+        schema_path (str): Path to the JSON schema file
+        mtime_ns (int): Modification time of the schema file, used as cache key
+
+    Returns:
+        Validator: A validator instance for the schema's draft
+
+    Raises:
+        SchemaError: If the schema itself is invalid
+    """
+    return _build_validator(load_standard_object_schema(schema_path))
+
+
+@lru_cache(maxsize=8)
+def _compile_fast_validator(
+    schema_path: str, mtime_ns: int
+) -> Optional[Callable[[Any], Any]]:
+    """
+    Compile a JSON schema into a plain Python validation function with fastjsonschema.
+
+    Cached on (path, modification time) like _compile_schema_validator.
+
+    Args:
+        schema_path (str): Path to the JSON schema file
+        mtime_ns (int): Modification time of the schema file, used as cache key
+
+    Returns:
+        Optional[Callable[[Any], Any]]: The compiled validation function, or None if
+            fastjsonschema is not installed or cannot compile the schema
+    """
+    if fastjsonschema is None:
+        return None
+
+    try:
+        # use_default=False keeps validation a pure check: by default, fastjsonschema
+        # fills in the schema's "default" values in the validated objects
+        return fastjsonschema.compile(
+            load_standard_object_schema(schema_path), use_default=False
+        )
+    except fastjsonschema.JsonSchemaException as e:
+        logger.warning(f"Could not compile schema with fastjsonschema, using jsonschema: {e}")
+        return None
+
+
+def _describe_validation_error(standard_object: dict, e: ValidationError) -> List[str]:
+    """
+    Describe where a schema validation error is located, its message, the failing value
+    and the schema requirement that failed.
+
+    Args:
+        standard_object (dict): The validated standard object
+        e (ValidationError): One of the errors reported for it
+
+    Returns:
+        List[str]: The lines of the description
+    """
+    location = " -> ".join(map(str, e.absolute_path)) if e.absolute_path else "Root level"
+    lines = [f"   Error Located: {location}", f"   Error Message: {e.message}"]
+
+    # Try to provide more context about the failing value
+    if e.absolute_path:
+        try:
+            failing_value = reduce(getitem, e.absolute_path, standard_object)
+            lines.append(f"   Failing Value: {failing_value}")
+            lines.append(f"   Value Type: {type(failing_value).__name__}")
+        except (KeyError, TypeError, IndexError):
+            lines.append("   Could not retrieve failing value")
+
+    # Show the schema requirement that failed
+    if hasattr(e, "schema"):
+        schema_info = e.schema
+        if isinstance(schema_info, dict):
+            if "type" in schema_info:
+                lines.append(f"   Expected Type: {schema_info['type']}")
+            if "required" in schema_info:
+                lines.append(f"   Required Fields: {schema_info['required']}")
+
+    return lines
 
 
 def validate_standard_object(
     standard_object: dict,
-    schema: dict,
+    validator: Union[Validator, Dict[str, Any]],
+    fast_validate: Optional[Callable[[Any], Any]] = None,
 ) -> bool:
     """
     Validate a standard object against the JSON schema with detailed error reporting.
 
+    All schema errors of the object are collected and logged, most relevant first,
+    without raising an exception per invalid object.
+
     Args:
         standard_object (dict): The processed standard object to validate
-        schema_path (str): Path to the JSON schema file
+        validator (Union[Validator, Dict[str, Any]]): Precompiled validator for the JSON
+            schema, or the schema itself, which is then checked and compiled on every call
+        fast_validate (Optional[Callable[[Any], Any]]): Schema compiled by
+            _compile_fast_validator. Objects it accepts pass straight away; the others
+            are checked again with validator to report the errors in detail.
 
     Returns:
         bool: True if validation passes, False otherwise
+
+    Raises:
+        TypeError: If validator is neither a validator nor a schema dictionary
     """
+    if not isinstance(validator, dict) and not hasattr(validator, "iter_errors"):
+        raise TypeError(
+            f"validator must be a jsonschema validator or a schema dict, not {type(validator).__name__}"
+        )
+
     try:
-        # Validate the object
-        validate(instance=standard_object, schema=schema)
+        if isinstance(validator, dict):
+            validator = _build_validator(validator)
 
-        logger.info("VALIDATION PASSED: Standard object conforms to schema")
-        logger.info(f"   - Object ID: {standard_object.get('id', 'Unknown')}")
-        return True
+        # Objects accepted by the compiled schema need no detailed check
+        errors = None
+        if fast_validate is not None:
+            try:
+                fast_validate(standard_object)
+                errors = []
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+
+        if errors is None:
+            errors = sorted(
+                validator.iter_errors(standard_object), key=relevance, reverse=True
+            )
 
-    except ValidationError as e:
-        logger.error("VALIDATION FAILED: Object does not conform to schema")
-        logger.error(f"Object ID: {standard_object.get('id', 'Unknown')}")
+        if not errors:
+            logger.info("VALIDATION PASSED: Standard object conforms to schema")
+            logger.info("   - Object ID: {}", standard_object.get("id", "Unknown"))
+            return True
+
+        # Report the object and all of its errors in a single log record
+        details = [
+            f"Object ID: {standard_object.get('id', 'Unknown')}",
+            f"   Schema errors: {len(errors)}",
+        ]
+        for e in errors:
+            details.extend(_describe_validation_error(standard_object, e))
         logger.error(
-            f"   Error Located: {' -> '.join(str(x) for x in e.absolute_path) if e.absolute_path else 'Root level'}"
+            "VALIDATION FAILED: Object does not conform to schema\n{}", "\n".join(details)
         )
-        logger.error(f"   Error Message: {e.message}")
-
-        # Try to provide more context about the failing value
-        if e.absolute_path:
-            failing_value = standard_object
-            try:
-                for path_element in e.absolute_path:
-                    failing_value = failing_value[path_element]
-                logger.warning(f"   Failing Value: {failing_value}")
-                logger.warning(f"   Value Type: {type(failing_value).__name__}")
-            except (KeyError, TypeError, IndexError):
-                logger.error("   Could not retrieve failing value")
-
-        # Show the schema requirement that failed
-        if hasattr(e, "schema"):
-            schema_info = e.schema
-            if isinstance(schema_info, dict):
-                if "type" in schema_info:
-                    logger.warning(f"   Expected Type: {schema_info['type']}")
-                if "required" in schema_info:
-                    logger.warning(f"   Required Fields: {schema_info['required']}")
 
         return False
 
@@ -63,6 +192,44 @@ def validate_standard_object(
         return False
 
 
+def _check_standard_object(
+    index: int,
+    standard_object: dict,
+    validator: Validator,
+    fast_validate: Optional[Callable[[Any], Any]],
+) -> Tuple[bool, Optional[str]]:
+    """
+    Validate one standard object of a batch.
+
+    Returns:
+        Tuple[bool, Optional[str]]: Whether the object is valid, and the message of
+            the unexpected error that prevented validating it, if any
+    """
+    try:
+        return validate_standard_object(standard_object, validator, fast_validate), None
+    except Exception as e:
+        logger.error(f"Unexpected error validating object {index}: {e}")
+        return False, str(e)
+
+
+def _init_worker(schema_path: str, mtime_ns: int) -> None:
+    """
+    Build the schema validators once in a pool worker, instead of pickling them.
+    """
+    global _worker_validators
+    _worker_validators = (
+        _compile_schema_validator(schema_path, mtime_ns),
+        _compile_fast_validator(schema_path, mtime_ns),
+    )
+
+
+def _check_in_worker(index: int, standard_object: dict) -> Tuple[bool, Optional[str]]:
+    """
+    Validate one standard object in a pool worker initialized by _init_worker.
+    """
+    return _check_standard_object(index, standard_object, *_worker_validators)
+
+
 def run_validations(
     cleaned_objects: List[Dict[str, Any]],
     schema_path: str,
@@ -70,6 +237,9 @@ def run_validations(
     """
     Validate all standard objects against the JSON schema.
 
+    Objects are independent, so large batches are validated on a process pool (see
+    `src.utils.parallel`); the results keep the input order either way.
+
     Args:
         cleaned_objects: List of cleaned standard objects to validate
         schema_path: Path to the JSON schema file
@@ -88,6 +258,19 @@ def run_validations(
             "failed_objects": [],
         }
 
+    mtime_ns = os.stat(schema_path).st_mtime_ns
+    try:
+        validator = _compile_schema_validator(schema_path, mtime_ns)
+    except SchemaError as e:
+        logger.error(f"Invalid JSON schema, cannot validate objects: {e.message}")
+        return {
+            "all_valid": False,
+            "total_objects": 0,
+            "valid_count": 0,
+            "failed_count": 0,
+            "failed_objects": [],
+        }
+
     if not cleaned_objects:
         logger.warning("No standard objects to validate.")
         return {
@@ -100,39 +283,47 @@ def run_validations(
 
     logger.info(f"Validating {len(cleaned_objects)} standard objects...")
 
-    validation_results = []
+    if use_process_pool(len(cleaned_objects)):
+        outcomes = list(
+            pool_map(
+                _check_in_worker,
+                range(len(cleaned_objects)),
+                cleaned_objects,
+                batch_size=len(cleaned_objects),
+                initializer=_init_worker,
+                initargs=(schema_path, mtime_ns),
+            )
+        )
+    else:
+        fast_validate = _compile_fast_validator(schema_path, mtime_ns)
+        outcomes = [
+            _check_standard_object(i, obj, validator, fast_validate)
+            for i, obj in enumerate(cleaned_objects)
+        ]
+
+    validation_results = [is_valid for is_valid, _ in outcomes]
+
+    # Only failures need a record; the counts follow from the number of failures
     failed_objects = []
+    for i, (is_valid, error) in enumerate(outcomes):
+        if is_valid:
+            continue
 
-    for i, obj in enumerate(cleaned_objects):
-        try:
-            is_valid = validate_standard_object(obj, schema)
-            validation_results.append(is_valid)
-
-            if not is_valid:
-                failed_objects.append(
-                    {
-                        "index": i,
-                        "id": obj.get("id", "Unknown"),
-                        "name": obj.get("name", "Unknown"),
-                    }
-                )
-        except Exception as e:
-            logger.error(f"Unexpected error validating object {i}: {e}")
-            validation_results.append(False)
-            failed_objects.append(
-                {
-                    "index": i,
-                    "id": obj.get("id", "Unknown"),
-                    "name": obj.get("name", "Unknown"),
-                    "error": str(e),
-                }
-            )
+        obj = cleaned_objects[i]
+        failed_object = {
+            "index": i,
+            "id": obj.get("id", "Unknown"),
+            "name": obj.get("name", "Unknown"),
+        }
+        if error is not None:
+            failed_object["error"] = error
+        failed_objects.append(failed_object)
 
     # Calculate summary
     total_objects = len(cleaned_objects)
-    valid_count = sum(validation_results)
     failed_count = len(failed_objects)
-    all_valid = all(validation_results)
+    valid_count = total_objects - failed_count
+    all_valid = failed_count == 0
 
     # Log summary
     if all_valid:
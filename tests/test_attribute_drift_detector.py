@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.utils import attribute_drift_detector
+from src.utils.attribute_drift_detector import save_analysis_report
+
+# Non-ASCII attribute names, and a nameless attribute reported under a null key
+_ANALYSIS_RESULTS = {
+    "total_objects_checked": 2,
+    "unexpected_attributes": {
+        "Élévation": {
+            "count": 1,
+            "found_in_objects": ["object-1"],
+            "similar_valid_names": ["Elevation"],
+        },
+        "Nom de l’unité": {
+            "count": 1,
+            "found_in_objects": ["object-2"],
+            "similar_valid_names": [],
+        },
+        None: {"count": 1, "found_in_objects": ["object-1"]},
+    },
+    "objects_with_issues": [
+        {"object_id": "object-1", "unexpected_attributes": ["Élévation", None]},
+        {"object_id": "object-2", "unexpected_attributes": ["Nom de l’unité"]},
+    ],
+}
+
+
+@unittest.skipIf(attribute_drift_detector.orjson is None, "orjson is not installed")
+class JsonReportTest(unittest.TestCase):
+    def _write_report(self, path):
+        self.assertTrue(save_analysis_report(_ANALYSIS_RESULTS, path, "json"))
+        with open(path, "rb") as file:
+            return file.read()
+
+    def test_orjson_and_stdlib_reports_are_identical(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            orjson_report = self._write_report(os.path.join(tmp_dir, "orjson.json"))
+            with mock.patch.object(attribute_drift_detector, "orjson", None):
+                stdlib_report = self._write_report(os.path.join(tmp_dir, "stdlib.json"))
+
+        self.assertIn("Élévation".encode("utf-8"), orjson_report)
+        self.assertIn(b'"null"', orjson_report)
+        self.assertEqual(stdlib_report, orjson_report)
+
+
+if __name__ == "__main__":
+    unittest.main()
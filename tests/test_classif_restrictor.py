@@ -0,0 +1,176 @@
+import copy
+import unittest
+
+from src.load.configs_loader import load_classification_config
+from src.transform.classif_restrictor import (
+    apply_restrictions,
+    compile_config,
+    find_most_restrictive_valid_ism,
+    is_classif_too_high,
+)
+
+
+_SECRET_ISM = {
+    "classification": "S",
+    "banner": "SECRET//REL TO USA, AUS, CAN, GBR, NZL",
+    "disseminationControls": ["REL"],
+    "releasableTo": ["USA", "AUS", "CAN", "GBR", "NZL"],
+}
+_TOP_SECRET_ISM = {"classification": "TS", "banner": "TOP SECRET"}
+_UNCLASSIFIED_ISM = {"classification": "U", "banner": "UNCLASSIFIED"}
+
+
+class RestrictionsConfigTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.config = load_classification_config("configs/classifications_config.yaml")
+
+    def test_raw_and_compiled_config_agree(self):
+        compiled = compile_config(self.config)
+        for ism in (_SECRET_ISM, _TOP_SECRET_ISM):
+            with self.subTest(ism=ism["banner"]):
+                self.assertEqual(
+                    is_classif_too_high(ism, self.config),
+                    is_classif_too_high(ism, compiled),
+                )
+
+    def test_apply_restrictions_accepts_raw_config(self):
+        standard_object = {
+            "ism": _SECRET_ISM,
+            "location": {"ism": _TOP_SECRET_ISM, "latitude": 1.0},
+        }
+
+        from_raw = apply_restrictions(copy.deepcopy(standard_object), self.config)
+        from_compiled = apply_restrictions(
+            copy.deepcopy(standard_object), compile_config(self.config)
+        )
+
+        self.assertEqual(from_raw, from_compiled)
+        self.assertIsNone(from_raw["location"])
+        self.assertEqual(from_raw["overallClassification"], _SECRET_ISM)
+
+
+class ApplyRestrictionsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.config = compile_config(
+            load_classification_config("configs/classifications_config.yaml")
+        )
+
+    def test_object_is_updated_in_place(self):
+        standard_object = {"ism": _SECRET_ISM, "name": "Site"}
+
+        result = apply_restrictions(standard_object, self.config)
+
+        self.assertIs(result, standard_object)
+        self.assertEqual(standard_object["overallClassification"], _SECRET_ISM)
+        self.assertIsNot(standard_object["overallClassification"], _SECRET_ISM)
+
+    def test_ism_nested_in_redacted_item_is_ignored(self):
+        confidential_ism = {"classification": "C", "banner": "CONFIDENTIAL"}
+        standard_object = {
+            "ism": _UNCLASSIFIED_ISM,
+            "location": {
+                "ism": {"classification": "S", "banner": "SECRET//SI", "sciControls": ["SI"]},
+                "source": {"ism": confidential_ism},
+            },
+        }
+
+        result = apply_restrictions(standard_object, self.config)
+
+        self.assertIsNone(result["location"])
+        self.assertEqual(result["overallClassification"], _UNCLASSIFIED_ISM)
+
+    def test_too_high_top_level_ism_drops_the_object(self):
+        standard_object = {"ism": _TOP_SECRET_ISM, "location": {"ism": _SECRET_ISM}}
+
+        self.assertIsNone(apply_restrictions(standard_object, self.config))
+
+    def test_equally_restrictive_isms_keep_the_first_visited(self):
+        # The traversal is depth first from the last key, so "b" is visited before "a"
+        first_ism = {"classification": "S", "banner": "SECRET", "ownerProducer": ["USA"]}
+        second_ism = {"classification": "S", "banner": "SECRET", "ownerProducer": ["GBR"]}
+        standard_object = {
+            "ism": _UNCLASSIFIED_ISM,
+            "a": {"ism": first_ism},
+            "b": [{"ism": second_ism}],
+        }
+
+        result = apply_restrictions(standard_object, self.config)
+
+        self.assertEqual(result["overallClassification"], second_ism)
+
+
+class FindMostRestrictiveValidIsmTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.config = load_classification_config("configs/classifications_config.yaml")
+
+    def test_skips_too_high_isms_without_modifying_the_object(self):
+        standard_object = {
+            "ism": _UNCLASSIFIED_ISM,
+            "location": {"ism": _TOP_SECRET_ISM},
+            "sources": [{"ism": _SECRET_ISM}],
+        }
+        original = copy.deepcopy(standard_object)
+
+        for config in (self.config, compile_config(self.config)):
+            result = find_most_restrictive_valid_ism(standard_object, config)
+            self.assertEqual(result, _SECRET_ISM)
+            self.assertIsNot(result, _SECRET_ISM)
+        self.assertEqual(standard_object, original)
+
+    def test_agrees_with_apply_restrictions(self):
+        standard_object = {"ism": _SECRET_ISM, "location": {"ism": _UNCLASSIFIED_ISM}}
+
+        expected = find_most_restrictive_valid_ism(standard_object, self.config)
+        result = apply_restrictions(standard_object, self.config)
+
+        self.assertEqual(result["overallClassification"], expected)
+
+    def test_no_valid_ism(self):
+        self.assertIsNone(
+            find_most_restrictive_valid_ism({"ism": _TOP_SECRET_ISM}, self.config)
+        )
+
+
+class NullIsmFieldsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.config = compile_config(
+            load_classification_config("configs/classifications_config.yaml")
+        )
+
+    def test_null_banner_with_forbidden_control_is_too_high(self):
+        ism = {"classification": "S", "banner": None, "disseminationControls": ["IMCON"]}
+
+        self.assertTrue(is_classif_too_high(ism, self.config))
+
+    def test_null_fields_are_treated_as_empty(self):
+        ism = {
+            "classification": "S",
+            "banner": None,
+            "sciControls": None,
+            "disseminationControls": None,
+        }
+
+        self.assertFalse(is_classif_too_high(ism, self.config))
+
+    def test_item_with_null_banner_is_redacted_not_dropped(self):
+        standard_object = {
+            "ism": _SECRET_ISM,
+            "location": {
+                "ism": {"classification": "S", "banner": None, "sciControls": ["SI"]},
+                "latitude": 1.0,
+            },
+        }
+
+        result = apply_restrictions(standard_object, self.config)
+
+        self.assertIsNotNone(result)
+        self.assertIsNone(result["location"])
+        self.assertEqual(result["overallClassification"], _SECRET_ISM)
+
+
+if __name__ == "__main__":
+    unittest.main()
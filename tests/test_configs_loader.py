@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+from src.load.configs_loader import (
+    load_attribute_mapping,
+    load_classification_config,
+    load_standard_object_schema,
+)
+
+
+class LoaderCopiesTest(unittest.TestCase):
+    """Mutating a loaded config must not leak into later loads of the same file."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def test_attribute_mapping(self):
+        path = self._write(
+            "mapping.yaml",
+            "attribute_mapping:\n  Name:\n    field: name\n    container: top\n",
+        )
+        load_attribute_mapping(path)["Name"]["field"] = "changed"
+        self.assertEqual(load_attribute_mapping(path)["Name"]["field"], "name")
+
+    def test_classification_config(self):
+        path = self._write(
+            "classifications.yaml", "restrictions:\n  sci_controls: [SI, TK]\n"
+        )
+        load_classification_config(path)["sci_controls"].append("HCS")
+        self.assertEqual(load_classification_config(path)["sci_controls"], ["SI", "TK"])
+
+    def test_schema(self):
+        path = self._write("schema.json", '{"required": ["id"]}')
+        load_standard_object_schema(path)["required"].clear()
+        self.assertEqual(load_standard_object_schema(path)["required"], ["id"])
+
+
+if __name__ == "__main__":
+    unittest.main()
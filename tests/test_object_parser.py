@@ -0,0 +1,118 @@
+import unittest
+
+from src.transform.object_parser import (
+    parse_facility_name_id,
+    parse_location,
+    parse_ship_class_name,
+    prepare_attribute_index,
+)
+
+
+def _source_object(elevation_name):
+    return {
+        "id": "object-1",
+        "attributes": {
+            "data": [
+                {"attributeName": "Name", "attributeValue": "Site"},
+                {"attributeName": elevation_name, "attributeValue": "1250.5"},
+            ]
+        },
+        "latestKnownLocation": {
+            "id": "location-1",
+            "geometry": {"coordinates": [116.78, 32.45]},
+        },
+    }
+
+
+class ParseLocationElevationTest(unittest.TestCase):
+    def test_elevation_name_is_matched_in_any_case(self):
+        for elevation_name in ("elevation", "ELEVATION (m)", "Elevation(m)"):
+            with self.subTest(elevation_name=elevation_name):
+                source = _source_object(elevation_name)
+                attr_index = prepare_attribute_index(source, {"Name": "name"})
+
+                location = parse_location(source, attr_index=attr_index)
+
+                self.assertEqual(location["elevation"]["value"], 1250.5)
+
+    def test_no_elevation_attribute(self):
+        source = _source_object("Height")
+        attr_index = prepare_attribute_index(source, {"Name": "name"})
+
+        location = parse_location(source, attr_index=attr_index)
+
+        self.assertIsNone(location["elevation"]["value"])
+
+
+def _object_with_attributes(class_name, attributes):
+    return {
+        "id": "object-1",
+        "className": class_name,
+        "name": "Object name",
+        "attributes": {
+            "data": [
+                {"attributeName": name, "attributeValue": value}
+                for name, value in attributes
+            ]
+        },
+    }
+
+
+class DuplicatedParserAttributesTest(unittest.TestCase):
+    def _parse(self, parser, source):
+        attr_index = prepare_attribute_index(source, {"Echelon": "x", "OSuffix": "y"})
+        return parser(source, {"id": source["id"]}, attr_index=attr_index)
+
+    def test_facility_id_is_the_first_osuffix_with_a_value(self):
+        source = _object_with_attributes(
+            "Facility", [("OSuffix", None), ("OSuffix", "F-1"), ("OSuffix", "F-2")]
+        )
+
+        result = self._parse(parse_facility_name_id, source)
+
+        self.assertEqual(result["facility"]["facilityId"]["value"], "F-1")
+
+    def test_trailing_none_osuffix_keeps_the_earlier_id(self):
+        source = _object_with_attributes("Facility", [("OSuffix", "F-1"), ("OSuffix", None)])
+
+        result = self._parse(parse_facility_name_id, source)
+
+        self.assertEqual(result["facility"]["facilityId"]["value"], "F-1")
+
+    def test_facility_without_osuffix_value_has_no_id(self):
+        source = _object_with_attributes("Facility", [("OSuffix", None)])
+
+        result = self._parse(parse_facility_name_id, source)
+
+        self.assertNotIn("facilityId", result["facility"])
+
+    def test_any_echelon_attribute_marks_a_ship(self):
+        source = _object_with_attributes(
+            "Destroyer", [("Echelon", "SHIP"), ("Echelon", None), ("Name", "First")]
+        )
+
+        result = self._parse(parse_ship_class_name, source)
+
+        self.assertEqual(result["maritimeMetadata"]["shipClass"]["value"], "Destroyer")
+
+    def test_ship_name_is_the_first_name_attribute(self):
+        source = _object_with_attributes(
+            "Destroyer", [("Name", "First"), ("Echelon", "SHIP"), ("Name", "Second")]
+        )
+
+        result = self._parse(parse_ship_class_name, source)
+
+        self.assertEqual(result["maritimeMetadata"]["shipName"]["value"], "First")
+
+    def test_none_valued_first_name_leaves_the_ship_unnamed(self):
+        source = _object_with_attributes(
+            "Destroyer", [("Echelon", "SHIP"), ("Name", None), ("Name", "Second")]
+        )
+
+        result = self._parse(parse_ship_class_name, source)
+
+        self.assertNotIn("shipName", result["maritimeMetadata"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import glob
+import json
+import os
+import tempfile
+import unittest
+
+from src.pipelines.oms_data_pipeline import _save_standard_objects
+
+
+class SaveStandardObjectsTest(unittest.TestCase):
+    def test_objects_sharing_an_id_keep_the_last_one(self):
+        objects = [
+            {"id": "shared", "name": "first", "payload": ["a"] * 1000},
+            {"id": "other", "name": "other"},
+            {"id": "shared", "name": "last"},
+        ]
+
+        with tempfile.TemporaryDirectory() as output_path:
+            _save_standard_objects(output_path, objects)
+
+            paths = sorted(glob.glob(os.path.join(output_path, "*.json")))
+            self.assertEqual(len(paths), 2)
+
+            shared_paths = [p for p in paths if os.path.basename(p).startswith("shared_")]
+            self.assertEqual(len(shared_paths), 1)
+            with open(shared_paths[0], "rb") as f:
+                self.assertEqual(json.load(f), {"id": "shared", "name": "last"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from unittest import mock
+
+from src.extract.object_extractor import fetch_all_objects
+from src.load.configs_loader import load_attribute_mapping, load_classification_config
+from src.transform.object_parser import iter_processed_objects
+from src.utils import parallel
+from src.utils.validater import run_validations
+
+_SCHEMA_PATH = "configs/schemas/standard_object_schema_v1.5.json"
+
+
+class ProcessPoolPathTest(unittest.TestCase):
+    """The process pool path gives the same results, in the same order, as the serial one."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.source_objects = fetch_all_objects("data/1_raw/input")
+        cls.attribute_mapping = load_attribute_mapping("configs/attribute_mapping.yaml")
+        cls.restrictions_config = load_classification_config(
+            "configs/classifications_config.yaml"
+        )
+
+    def _process(self):
+        return list(
+            iter_processed_objects(
+                self.source_objects, self.attribute_mapping, self.restrictions_config
+            )
+        )
+
+    def _with_pool(self, func, *args):
+        with mock.patch.object(parallel, "MAX_WORKERS", 2), mock.patch.object(
+            parallel, "PARALLEL_MIN_OBJECTS", 2
+        ), mock.patch.object(
+            parallel, "ProcessPoolExecutor", wraps=parallel.ProcessPoolExecutor
+        ) as executor:
+            result = func(*args)
+        executor.assert_called_once()
+        return result
+
+    def test_iter_processed_objects(self):
+        serial = self._process()
+
+        self.assertTrue(serial)
+        self.assertEqual(self._with_pool(self._process), serial)
+
+    def test_run_validations(self):
+        standard_objects = self._process()
+        serial = run_validations(standard_objects, _SCHEMA_PATH)
+
+        self.assertEqual(
+            self._with_pool(run_validations, standard_objects, _SCHEMA_PATH), serial
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
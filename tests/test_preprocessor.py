@@ -0,0 +1,59 @@
+import os
+import time
+import unittest
+
+from src.transform.preprocessor import prepare_object_dates
+
+
+def _convert(date_str):
+    """Run a date string through prepare_object_dates as the date of introduction."""
+    obj = {
+        "lastVerified": {"timestamp": date_str},
+        "attributes": {
+            "data": [{"attributeName": "Date Of Introduction", "attributeValue": date_str}]
+        },
+    }
+    prepare_object_dates(obj)
+
+    # Both fields go through the same conversion
+    assert obj["lastVerified"]["timestamp"] == obj["attributes"]["data"][0]["attributeValue"]
+    return obj["lastVerified"]["timestamp"]
+
+
+class PrepareDatesTest(unittest.TestCase):
+    def test_date_only_is_midnight_utc(self):
+        self.assertEqual(_convert("2024-03-10"), 1710028800)
+        self.assertEqual(_convert("1970-01-01"), 0)
+        self.assertEqual(_convert("1969-12-31"), -86400)
+
+    def test_utc_timestamp(self):
+        self.assertEqual(_convert("2024-03-10T12:34:56Z"), 1710074096)
+
+    def test_fractional_seconds_are_truncated(self):
+        self.assertEqual(_convert("2024-03-10T12:34:56.789Z"), 1710074096)
+        self.assertEqual(_convert("2024-03-10T12:34:56.000001Z"), 1710074096)
+
+    def test_unsupported_values_are_left_untouched(self):
+        self.assertEqual(_convert("10/03/2024"), "10/03/2024")
+        self.assertEqual(_convert("2024-03-10T12:34:56+01:00"), "2024-03-10T12:34:56+01:00")
+
+
+@unittest.skipUnless(hasattr(time, "tzset"), "time.tzset is not available")
+class PrepareDatesNonUtcHostTest(PrepareDatesTest):
+    """Same expectations on a host whose local time zone is not UTC."""
+
+    def setUp(self):
+        self._saved_tz = os.environ.get("TZ")
+        os.environ["TZ"] = "America/New_York"
+        time.tzset()
+
+    def tearDown(self):
+        if self._saved_tz is None:
+            del os.environ["TZ"]
+        else:
+            os.environ["TZ"] = self._saved_tz
+        time.tzset()
+
+
+if __name__ == "__main__":
+    unittest.main()
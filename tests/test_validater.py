@@ -0,0 +1,25 @@
+import unittest
+
+from src.utils.validater import validate_standard_object
+
+
+_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["id"],
+    "properties": {"id": {"type": "string"}},
+}
+
+
+class ValidateStandardObjectTest(unittest.TestCase):
+    def test_accepts_a_schema_dict(self):
+        self.assertTrue(validate_standard_object({"id": "object-1"}, _SCHEMA))
+        self.assertFalse(validate_standard_object({"id": 1}, _SCHEMA))
+
+    def test_rejects_other_validator_types(self):
+        with self.assertRaises(TypeError):
+            validate_standard_object({"id": "object-1"}, "schema.json")
+
+
+if __name__ == "__main__":
+    unittest.main()